@@ -1,8 +1,10 @@
 """Agent setup with Strands + Bedrock."""
 
 import atexit
+import functools
 import logging
 import time
+from collections.abc import KeysView
 from pathlib import Path
 from typing import Any, Callable, Optional
 
@@ -245,6 +247,16 @@ def create_agent(config: dict) -> Agent:
     return agent
 
 
+def tool_names(agent: Agent) -> KeysView[str]:
+    """Names of the tools registered on ``agent``.
+
+    A live view of the registry keys: O(1) membership and set comparisons
+    (``{"safe_shell", "editor"} <= tool_names(agent)``) without copying, and
+    always current after tools are added or reloaded.
+    """
+    return agent.tool_registry.registry.keys()
+
+
 def _register_phase2_tools(config: dict) -> list:
     """Register Phase 2 tools conditionally based on availability."""
     tools = []
@@ -284,13 +296,19 @@ def _register_phase2_tools(config: dict) -> list:
             code_execute, 
             kb_retrieve, 
             memory_recall, 
+            memory_recall_batch, 
             memory_store, 
+            memory_store_batch, 
             set_region, 
             web_browse, 
             web_search
         )
         set_region(config["model"]["region"])
-        tools.extend([web_browse, web_search, kb_retrieve, memory_store, memory_recall, code_execute])
+        tools.extend([
+            web_browse, web_search, kb_retrieve,
+            memory_store, memory_store_batch, memory_recall, memory_recall_batch,
+            code_execute,
+        ])
         logger.info("Registered AgentCore tools (region: %s)", config["model"]["region"])
     except ImportError:
         logger.info("AgentCore tools not available — install boto3 to enable")
@@ -307,19 +325,43 @@ def _load_system_prompt(workspace: Path) -> str:
     Missing files are logged but not treated as errors (E-11).
     Falls back to DEFAULT_SYSTEM_PROMPT if no content is found, to prevent
     Bedrock Converse API ParamValidationError on empty system prompt (Issue #95).
-    """
-    parts: list[str] = []
 
+    Results are cached per workspace; the cache key includes each file's
+    mtime and size, so edits to either file are picked up on the next call.
+    """
     agents_md = workspace / "AGENTS.md"
     soul_md = workspace / "SOUL.md"
+    return _load_system_prompt_cached(
+        agents_md, _file_signature(agents_md), soul_md, _file_signature(soul_md)
+    )
+
+
+def _file_signature(path: Path) -> Optional[tuple[int, int]]:
+    """Return (mtime_ns, size) for path, or None if it does not exist."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+@functools.lru_cache(maxsize=32)
+def _load_system_prompt_cached(
+    agents_md: Path,
+    agents_sig: Optional[tuple[int, int]],
+    soul_md: Path,
+    soul_sig: Optional[tuple[int, int]],
+) -> str:
+    """Read and join the prompt files; the signatures only key the cache."""
+    parts: list[str] = []
 
-    if agents_md.exists():
+    if agents_sig is not None:
         parts.append(agents_md.read_text(encoding="utf-8"))
         logger.info("Loaded AGENTS.md (%d chars)", len(parts[-1]))
     else:
         logger.warning("AGENTS.md not found at %s — will use fallback if no other prompt sources", agents_md)
 
-    if soul_md.exists():
+    if soul_sig is not None:
         parts.append(soul_md.read_text(encoding="utf-8"))
         logger.info("Loaded SOUL.md (%d chars)", len(parts[-1]))
     else:
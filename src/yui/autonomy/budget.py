@@ -9,35 +9,70 @@ from __future__ import annotations
 import json
 import logging
 import os
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# orjson is optional — C-accelerated (de)serialization straight to/from bytes
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize ``obj`` to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes; both backends raise json.JSONDecodeError subclasses."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 # ---------------------------------------------------------------------------
 # Bedrock pricing (per 1K tokens, us-east-1, 2026)
 # ---------------------------------------------------------------------------
 
-BEDROCK_PRICING: dict[str, dict[str, float]] = {
-    "us.anthropic.claude-sonnet-4-20250514-v1:0": {
+BEDROCK_PRICING: Mapping[str, Mapping[str, float]] = MappingProxyType({
+    "us.anthropic.claude-sonnet-4-20250514-v1:0": MappingProxyType({
         "input_per_1k": 0.003,
         "output_per_1k": 0.015,
-    },
-    "us.anthropic.claude-haiku-3-20250307-v1:0": {
+    }),
+    "us.anthropic.claude-haiku-3-20250307-v1:0": MappingProxyType({
         "input_per_1k": 0.00025,
         "output_per_1k": 0.00125,
-    },
+    }),
+})
+
+# (input, output) price per 1K tokens — one lookup and a tuple unpack per call
+_PRICE_PER_1K: dict[str, tuple[float, float]] = {
+    model_id: (pricing["input_per_1k"], pricing["output_per_1k"])
+    for model_id, pricing in BEDROCK_PRICING.items()
 }
+# Unknown models are charged at Sonnet pricing
+_FALLBACK_PRICE_PER_1K = _PRICE_PER_1K["us.anthropic.claude-sonnet-4-20250514-v1:0"]
+
+
+# One buffered write per save instead of many small ones
+_WRITE_BUFFER_SIZE = 64 * 1024
 
 
 # ---------------------------------------------------------------------------
 # Data model
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class UsageRecord:
     """A single API invocation's token usage."""
 
@@ -66,19 +101,30 @@ class CostBudgetGuard:
     warning_threshold_pct:
         Percentage of budget at which a warning is emitted.
     usage_file:
-        Path to the JSON file storing usage records.
+        Path to the JSONL file storing usage records, one record per line.
+        Records are appended as they are made; a legacy ``{"records": [...]}``
+        JSON file is read and rewritten as JSONL on load.
     """
 
     def __init__(
         self,
         max_monthly_usd: float = 50.0,
         warning_threshold_pct: float = 80.0,
-        usage_file: str = "~/.yui/usage.json",
+        usage_file: str = "~/.yui/usage.jsonl",
     ) -> None:
         self.max_monthly_usd = max_monthly_usd
         self.warning_threshold_pct = warning_threshold_pct
         self.usage_file = Path(os.path.expanduser(usage_file))
         self.records: list[UsageRecord] = []
+        # Records made inside batch() are written together when it exits
+        self._pending: list[UsageRecord] = []
+        self._batch_depth = 0
+        # Running total for one "YYYY-MM" month, kept current by record_usage.
+        # It is valid while len(self.records) == _month_count; records added to
+        # the public list any other way trigger a recompute.
+        self._month_key: str | None = None
+        self._month_total_usd = 0.0
+        self._month_count = 0
         self._load_usage()
 
     # ------------------------------------------------------------------
@@ -103,20 +149,49 @@ class CostBudgetGuard:
             output_tokens=output_tokens,
             estimated_cost_usd=cost,
         )
-        self.records.append(record)
-        self._save_usage()
+        month_key = record.timestamp[:7]
+        if month_key == self._month_key and len(self.records) == self._month_count:
+            self._month_total_usd += cost
+            self._month_count += 1
+            self.records.append(record)
+        else:
+            self.records.append(record)
+            self._month_total(month_key)
+        if self._batch_depth:
+            self._pending.append(record)
+        else:
+            self._append_usage([record])
         return record
 
+    def record_usage_many(
+        self,
+        entries: Iterable[tuple[str, int, int]],
+    ) -> list[UsageRecord]:
+        """Record several ``(model_id, input_tokens, output_tokens)`` invocations.
+
+        All records are appended to the usage file in a single write.
+        """
+        with self.batch():
+            return [self.record_usage(*entry) for entry in entries]
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defer usage-file writes until the outermost ``batch()`` block exits."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._pending:
+                pending, self._pending = self._pending, []
+                self._append_usage(pending)
+
     def get_monthly_cost(self) -> float:
         """Return the total estimated cost for the current calendar month."""
-        now = datetime.now(timezone.utc)
-        current_month = now.strftime("%Y-%m")
-
-        total = 0.0
-        for rec in self.records:
-            if rec.timestamp[:7] == current_month:
-                total += rec.estimated_cost_usd
-        return total
+        current_month = datetime.now(timezone.utc).strftime("%Y-%m")
+        if current_month == self._month_key and len(self.records) == self._month_count:
+            return self._month_total_usd
+        return self._month_total(current_month)
 
     def check_budget(self) -> tuple[bool, str]:
         """Check current spend against the monthly budget.
@@ -129,14 +204,14 @@ class CostBudgetGuard:
         if self.max_monthly_usd <= 0:
             return True, "ok"
 
-        pct = (cost / self.max_monthly_usd) * 100
-
-        if pct >= 100:
+        # Compare in dollars; the percentage is only needed for the warning text
+        if cost >= self.max_monthly_usd:
             msg = f"Budget exceeded: ${cost:.2f}/${self.max_monthly_usd:.2f}"
             logger.error(msg)
             return False, msg
 
-        if pct >= self.warning_threshold_pct:
+        if cost * 100 >= self.max_monthly_usd * self.warning_threshold_pct:
+            pct = (cost / self.max_monthly_usd) * 100
             msg = f"Budget warning: ${cost:.2f}/${self.max_monthly_usd:.2f} ({pct:.0f}%)"
             logger.warning(msg)
             return True, msg
@@ -146,6 +221,10 @@ class CostBudgetGuard:
     def reset(self) -> None:
         """Clear all usage records and persist the empty state."""
         self.records.clear()
+        self._pending.clear()
+        self._month_key = None
+        self._month_total_usd = 0.0
+        self._month_count = 0
         self._save_usage()
         logger.info("Usage records reset.")
 
@@ -153,40 +232,75 @@ class CostBudgetGuard:
     # Private helpers
     # ------------------------------------------------------------------
 
+    def _month_total(self, month_key: str) -> float:
+        """Recompute and cache the total for *month_key* ("YYYY-MM")."""
+        total = sum(
+            rec.estimated_cost_usd for rec in self.records
+            if rec.timestamp.startswith(month_key)
+        )
+        self._month_key = month_key
+        self._month_total_usd = total
+        self._month_count = len(self.records)
+        return total
+
     @staticmethod
     def _estimate_cost(model_id: str, input_tokens: int, output_tokens: int) -> float:
         """Estimate USD cost for a single invocation."""
-        pricing = BEDROCK_PRICING.get(model_id)
-        if pricing is None:
-            # Unknown model — use sonnet pricing as fallback
-            pricing = BEDROCK_PRICING.get(
-                "us.anthropic.claude-sonnet-4-20250514-v1:0",
-                {"input_per_1k": 0.003, "output_per_1k": 0.015},
-            )
-        input_cost = (input_tokens / 1000) * pricing["input_per_1k"]
-        output_cost = (output_tokens / 1000) * pricing["output_per_1k"]
-        return input_cost + output_cost
+        input_per_1k, output_per_1k = _PRICE_PER_1K.get(model_id, _FALLBACK_PRICE_PER_1K)
+        return (input_tokens / 1000) * input_per_1k + (output_tokens / 1000) * output_per_1k
 
     def _load_usage(self) -> None:
-        """Load records from the JSON file."""
-        if not self.usage_file.exists():
+        """Load records from the JSONL file (or a legacy JSON document)."""
+        source = self.usage_file
+        if not source.exists() and source.suffix == ".jsonl":
+            # Pre-JSONL installs kept the same records in usage.json
+            source = source.with_suffix(".json")
+        if not source.exists():
             self.records = []
             return
 
+        content = source.read_bytes()
         try:
-            with open(self.usage_file) as f:
-                data = json.load(f)
-
-            self.records = [
-                UsageRecord(**rec) for rec in data.get("records", [])
-            ]
-        except (json.JSONDecodeError, TypeError, KeyError) as exc:
-            logger.warning("Could not load usage file %s: %s", self.usage_file, exc)
-            self.records = []
+            data = _json_loads(content)
+        except json.JSONDecodeError:
+            data = None  # several lines (JSONL) or corrupt — parse line by line
+
+        if isinstance(data, dict) and "records" in data:
+            try:
+                self.records = [UsageRecord(**rec) for rec in data["records"]]
+            except TypeError as exc:
+                logger.warning("Could not load usage file %s: %s", source, exc)
+                self.records = []
+                return
+            self._save_usage()  # migrate to JSONL so appends stay line-oriented
+            return
+
+        self.records = []
+        skipped = 0
+        last_error: Exception | None = None
+        for line in content.splitlines():
+            if not line.strip():
+                continue
+            try:
+                self.records.append(UsageRecord(**_json_loads(line)))
+            except (json.JSONDecodeError, TypeError) as exc:
+                skipped += 1
+                last_error = exc
+        if skipped:
+            logger.warning(
+                "Skipped %d unreadable line(s) in usage file %s: %s",
+                skipped, source, last_error,
+            )
+
+    def _append_usage(self, records: list[UsageRecord]) -> None:
+        """Append records as JSONL lines in a single write."""
+        self.usage_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.usage_file, "ab") as f:
+            f.write(b"".join(_json_dumps(asdict(rec)) + b"\n" for rec in records))
 
     def _save_usage(self) -> None:
-        """Persist records to the JSON file."""
+        """Rewrite the JSONL file from ``self.records`` (reset / migration)."""
         self.usage_file.parent.mkdir(parents=True, exist_ok=True)
-        data = {"records": [asdict(r) for r in self.records]}
-        with open(self.usage_file, "w") as f:
-            json.dump(data, f, indent=2)
+        with open(self.usage_file, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+            for record in self.records:
+                f.write(_json_dumps(asdict(record)) + b"\n")
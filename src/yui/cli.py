@@ -7,7 +7,6 @@ import readline
 import sys
 from pathlib import Path
 
-from yui.agent import create_agent
 from yui.config import load_config
 
 # History file for readline persistence (AC-08)
@@ -150,6 +149,9 @@ def main() -> None:
 
 def _run_repl(config: dict) -> None:
     """Run CLI REPL."""
+    # Imported here: yui.agent pulls in strands and boto3, which only the REPL needs
+    from yui.agent import create_agent
+
     # Create agent (AC-02, AC-05)
     try:
         agent = create_agent(config)
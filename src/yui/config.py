@@ -1,11 +1,14 @@
 """Configuration loading and validation."""
 
-import os
+import functools
+import pickle
 from pathlib import Path
 from typing import Any, Optional
 
 import yaml
 
+# libyaml's C parser when PyYAML was built with it; resolved once at import
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 DEFAULT_CONFIG: dict[str, Any] = {
     "model": {
@@ -181,21 +184,20 @@ def load_config(config_path: Optional[str] = None) -> dict[str, Any]:
         ConfigError: If config file exists but is invalid.
     """
     if config_path is None:
-        config_path = os.path.expanduser("~/.yui/config.yaml")
+        config_path = "~/.yui/config.yaml"
 
-    path = Path(config_path).expanduser()
-
-    if not path.exists():
-        return _deep_copy(DEFAULT_CONFIG)
+    path = Path(config_path)
+    if str(config_path).startswith("~"):  # expanduser only rewrites a leading ~
+        path = path.expanduser()
 
     try:
-        with open(path) as f:
-            user_config = yaml.safe_load(f)
-    except yaml.YAMLError as e:
-        raise ConfigError(f"Invalid YAML in {path}: {e}") from e
+        st = path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        return _default_config()
 
+    user_config = _read_user_config(path, st.st_mtime_ns, st.st_size)
     if user_config is None:
-        return _deep_copy(DEFAULT_CONFIG)
+        return _default_config()
 
     if not isinstance(user_config, dict):
         raise ConfigError(
@@ -203,15 +205,30 @@ def load_config(config_path: Optional[str] = None) -> dict[str, Any]:
         )
 
     # Merge with defaults
-    config = _deep_copy(DEFAULT_CONFIG)
-    _deep_merge(config, user_config)
+    config = _default_config()
+    _deep_merge(config, _copy(user_config))
 
     # Validate required fields
     _validate(config)
-
     return config
 
 
+@functools.lru_cache(maxsize=32)
+def _read_user_config(path: Path, mtime_ns: int, size: int) -> Any:
+    """Parse the user config file; the mtime and size only key the cache.
+
+    Editing the file changes the key, so stale entries are never returned.
+    Only the file's own content is cached: load_config merges it onto a fresh
+    copy of DEFAULT_CONFIG on every call, so changes to the defaults are
+    always picked up. Callers must not mutate the returned data.
+    """
+    try:
+        with open(path) as f:
+            return yaml.load(f, _YAML_LOADER)
+    except yaml.YAMLError as e:
+        raise ConfigError(f"Invalid YAML in {path}: {e}") from e
+
+
 def _validate(config: dict[str, Any]) -> None:
     """Validate config after merge."""
     model = config.get("model", {})
@@ -227,23 +244,24 @@ def _validate(config: dict[str, Any]) -> None:
         raise ConfigError("tools.shell.blocklist must be a list")
 
 
-def _deep_copy(d: dict) -> dict:
-    """Simple deep copy for nested dicts/lists."""
-    out: dict = {}
-    for k, v in d.items():
-        if isinstance(v, dict):
-            out[k] = _deep_copy(v)
-        elif isinstance(v, list):
-            out[k] = v[:]
-        else:
-            out[k] = v
-    return out
+def _default_config() -> dict[str, Any]:
+    """Return an independent deep copy of DEFAULT_CONFIG as it is now."""
+    return _copy(DEFAULT_CONFIG)
+
+
+def _copy(data: Any) -> Any:
+    """Deep-copy plain YAML data via a pickle round trip (C-level, faster than deepcopy)."""
+    return pickle.loads(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
 
 
 def _deep_merge(base: dict, override: dict) -> None:
     """Deep merge override into base (mutates base)."""
-    for key, value in override.items():
-        if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-            _deep_merge(base[key], value)
-        else:
-            base[key] = value
+    stack = [(base, override)]
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            current = dst.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                stack.append((current, value))
+            else:
+                dst[key] = value
@@ -5,10 +5,20 @@ Falls back gracefully with clear error messages when AWS resources
 are not provisioned.
 """
 
+from __future__ import annotations
+
+import atexit
+import functools
 import logging
 import os
+import random
+import threading
+import time
 import yaml
 import urllib.parse
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
 
 from strands import tool
 
@@ -22,9 +32,36 @@ try:
 except ImportError:
     BOTO3_AVAILABLE = False
 
+# AWS error codes the AgentCore tools map to user-facing messages / retries
+_ACCESS_DENIED = "AccessDeniedException"
+_NOT_FOUND = "ResourceNotFoundException"
+_TRANSIENT_ERROR_CODES = frozenset({
+    "ThrottlingException",
+    "ServiceUnavailableException",
+    "InternalServerException",
+})
+
+
+# Memory retry backoff: full jitter over an exponentially growing window
+_RETRY_BACKOFF_BASE = 0.5
+_RETRY_BACKOFF_MAX = 8.0
+
+
+def _retry_delay(attempt: int) -> float:
+    """Seconds to wait before retry number ``attempt + 1`` (0-based attempt)."""
+    return random.uniform(0, min(_RETRY_BACKOFF_MAX, _RETRY_BACKOFF_BASE * (2 ** attempt)))
+
+
+def _error_code(error: Exception) -> str:
+    """Return the AWS error code of a botocore ClientError, or "" for anything else."""
+    if BOTO3_AVAILABLE and isinstance(error, ClientError):
+        return error.response.get("Error", {}).get("Code", "")
+    return ""
+
+
 # AgentCore tools are optional — gracefully handle missing SDK
 try:
-    from bedrock_agentcore.tools.browser_client import browser_session
+    from bedrock_agentcore.tools.browser_client import BrowserClient, browser_session
     from bedrock_agentcore.tools.code_interpreter_client import code_session
     from bedrock_agentcore.memory.client import MemoryClient
     AGENTCORE_AVAILABLE = True
@@ -50,12 +87,158 @@ def set_region(region: str) -> None:
     _REGION = region
 
 
+class _BrowserPool:
+    """Bounded pool of AgentCore browser sessions reused across web_browse calls.
+
+    At most ``max_sessions`` sessions are checked out at once; further callers
+    wait for a free slot. Released sessions are kept idle per (region,
+    identifier) and handed out again until they have been idle for
+    ``idle_ttl`` seconds; expired ones are stopped on the next acquire or
+    release, so no background reaper thread is needed.
+    """
+
+    def __init__(self, max_sessions: int, idle_ttl: float):
+        self.max_sessions = max_sessions
+        self.idle_ttl = idle_ttl
+        self.created = 0
+        self.reused = 0
+        self.active = 0
+        self._idle: dict[tuple[str, Optional[str]], list[tuple[BrowserClient, float]]] = {}
+        self._slots = threading.BoundedSemaphore(max_sessions)
+        self._lock = threading.Lock()
+
+    def acquire(self, identifier: Optional[str], timeout: Optional[float] = None) -> BrowserClient:
+        """Check out a session, reusing the most recently released fresh one.
+
+        Raises TimeoutError if no slot frees up within ``timeout`` seconds.
+        """
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError(f"all {self.max_sessions} browser sessions busy")
+        try:
+            client = self._take_idle((_REGION, identifier))
+            if client is None:
+                client = BrowserClient(_REGION)
+                if identifier:
+                    client.start(identifier=identifier)
+                else:
+                    client.start()
+                with self._lock:
+                    self.created += 1
+        except BaseException:
+            self._slots.release()
+            raise
+        with self._lock:
+            self.active += 1
+        return client
+
+    def release(
+        self, client: BrowserClient, identifier: Optional[str], healthy: bool = True
+    ) -> None:
+        """Return a checked-out session; unhealthy ones are stopped, not pooled."""
+        if healthy:
+            with self._lock:
+                self._idle.setdefault((_REGION, identifier), []).append((client, time.monotonic()))
+            self._reap()
+        else:
+            _stop_browser(client)
+        with self._lock:
+            self.active -= 1
+        self._slots.release()
+
+    def idle_count(self) -> int:
+        with self._lock:
+            return sum(len(entries) for entries in self._idle.values())
+
+    def close(self) -> None:
+        """Stop every idle session."""
+        with self._lock:
+            entries = [client for idle in self._idle.values() for client, _ in idle]
+            self._idle.clear()
+        for client in entries:
+            _stop_browser(client)
+
+    def _take_idle(self, key: tuple[str, Optional[str]]) -> Optional[BrowserClient]:
+        self._reap()
+        with self._lock:
+            idle = self._idle.get(key)
+            if not idle:
+                return None
+            client, _ = idle.pop()
+            self.reused += 1
+            return client
+
+    def _reap(self) -> None:
+        """Stop sessions idle past the TTL, and the oldest beyond ``max_sessions`` idle."""
+        now = time.monotonic()
+        expired: list[BrowserClient] = []
+        with self._lock:
+            for key in list(self._idle):
+                fresh = []
+                for client, released_at in self._idle[key]:
+                    if now - released_at < self.idle_ttl:
+                        fresh.append((client, released_at))
+                    else:
+                        expired.append(client)
+                self._idle[key] = fresh
+            surplus = sum(len(idle) for idle in self._idle.values()) - self.max_sessions
+            if surplus > 0:
+                oldest = sorted(
+                    ((released_at, key, client) for key, idle in self._idle.items()
+                     for client, released_at in idle),
+                    key=lambda entry: entry[0],
+                )[:surplus]
+                for _, key, client in oldest:
+                    self._idle[key] = [e for e in self._idle[key] if e[0] is not client]
+                    expired.append(client)
+            for key in [k for k, idle in self._idle.items() if not idle]:
+                del self._idle[key]
+        for client in expired:
+            _stop_browser(client)
+
+
+def _stop_browser(client: BrowserClient) -> None:
+    """Stop a browser session; failures (e.g. StopBrowserSession denied) are only logged."""
+    try:
+        client.stop()
+    except Exception as e:
+        logger.warning("Browser session cleanup failed (session: %s): %s", client.session_id, e)
+
+
+def _reset_page(page: Any, session_id: Optional[str]) -> bool:
+    """Blank the page and drop its cookies before the session goes back to the pool.
+
+    Returns False if the reset failed, so the session is stopped instead of
+    handing the previous caller's page or login to the next one.
+    """
+    try:
+        page.goto("about:blank")
+        page.context.clear_cookies()
+    except Exception as e:
+        logger.warning("Browser session reset failed (session: %s): %s", session_id, e)
+        return False
+    return True
+
+
+# Concurrent AgentCore browser sessions web_browse may hold; AgentCore caps
+# live sessions per account, and each one is a remote Chrome.
+_BROWSER_MAX_SESSIONS = 3
+_BROWSER_SESSION_IDLE_TTL = 300.0
+_browser_pool = _BrowserPool(max_sessions=_BROWSER_MAX_SESSIONS, idle_ttl=_BROWSER_SESSION_IDLE_TTL)
+
+
+@atexit.register
+def _close_browser_pool() -> None:
+    """Stop all pooled browser sessions on interpreter exit."""
+    _browser_pool.close()
+
+
 @tool
 def web_browse(url: str, task: str = "extract main content", timeout: int = 30) -> str:
     """Browse a web page using AgentCore cloud-managed Chrome browser.
 
-    Creates a temporary browser session, navigates to the URL,
-    and extracts content based on the task description.
+    Reuses an idle browser session from a previous call when available,
+    navigates to the URL, and extracts content based on the task description.
+    The page is blanked and its cookies cleared before the session is reused.
 
     Args:
         url: URL to browse.
@@ -75,51 +258,44 @@ def web_browse(url: str, task: str = "extract main content", timeout: int = 30)
         )
 
     session_id = None
-    _browse_result = None
     try:
         browser_identifier = os.environ.get("YUI_AGENTCORE_BROWSER_ID") or None
-        try:
-            with browser_session(region=_REGION, identifier=browser_identifier) as browser:
-                session_id = browser.session_id
-                logger.info("Browser session started: %s (identifier: %s)", session_id, browser_identifier)
+        browser = _browser_pool.acquire(browser_identifier, timeout=timeout)
+        session_id = browser.session_id
+        logger.info("Browser session ready: %s (identifier: %s)", session_id, browser_identifier)
 
+        try:
+            ws_url, ws_headers = browser.generate_ws_headers()
+            with sync_playwright() as p:
+                b = p.chromium.connect_over_cdp(ws_url, headers=ws_headers)
                 try:
-                    ws_url, ws_headers = browser.generate_ws_headers()
-                    with sync_playwright() as p:
-                        b = p.chromium.connect_over_cdp(ws_url, headers=ws_headers)
-                        try:
-                            page = b.contexts[0].pages[0] if b.contexts and b.contexts[0].pages else b.new_page()
-                            page.goto(url, timeout=timeout * 1000)
-                            content_text = page.content()
-                        finally:
-                            b.close()
-                    _browse_result = content_text[:5000] if content_text else "(no content)"
-                except Exception as inner_e:
-                    logger.error("Browser automation error (session: %s): %s", session_id, inner_e)
-                    _browse_result = f"Error browsing {url}: {inner_e}"
-        except Exception as ctx_e:
-            # StopBrowserSession may fail with AccessDeniedException even when browse succeeded
-            if _browse_result is not None:
-                err_msg = str(ctx_e)
-                if "StopBrowserSession" in err_msg or "AccessDeniedException" in err_msg:
-                    logger.warning("Browser session cleanup failed (result already obtained): %s", ctx_e)
-                else:
-                    raise
-            else:
-                # No result obtained yet (e.g. __enter__ failed) — propagate to outer handler
-                raise
-        if _browse_result is not None:
-            return _browse_result
+                    page = b.contexts[0].pages[0] if b.contexts and b.contexts[0].pages else b.new_page()
+                    page.goto(url, timeout=timeout * 1000)
+                    content_text = page.content()
+                    healthy = _reset_page(page, session_id)
+                finally:
+                    # On a CDP connection close() only disconnects this client;
+                    # the remote browser stays up for the next call.
+                    b.close()
+        except Exception as inner_e:
+            logger.error("Browser automation error (session: %s): %s", session_id, inner_e)
+            # Don't hand a possibly broken session to the next caller
+            _browser_pool.release(browser, browser_identifier, healthy=False)
+            return f"Error browsing {url}: {inner_e}"
+
+        _browser_pool.release(browser, browser_identifier, healthy=healthy)
+        return content_text[:5000] if content_text else "(no content)"
 
     except Exception as e:
         error_msg = str(e)
-        if "AccessDeniedException" in error_msg:
+        error_code = _error_code(e)
+        if error_code == _ACCESS_DENIED:
             return (
                 "Error: No permission to use AgentCore Browser. "
                 "Ensure IAM role has bedrock-agentcore:* permissions. "
                 f"Session: {session_id or 'not started'}"
             )
-        if "ResourceNotFoundException" in error_msg:
+        if error_code == _NOT_FOUND:
             return (
                 "Error: AgentCore Browser not provisioned. "
                 "Create a browser resource in AWS Bedrock Console first. "
@@ -131,16 +307,66 @@ def web_browse(url: str, task: str = "extract main content", timeout: int = 30)
         return f"Error browsing {url}: {e}"
 
 
-# Memory client singleton (created on first use)
-_memory_client = None
-
-
-def _get_memory_client() -> "MemoryClient":
-    """Get or create the memory client singleton."""
-    global _memory_client
-    if _memory_client is None:
-        _memory_client = MemoryClient(region_name=_REGION)
-    return _memory_client
+def _get_memory_client() -> MemoryClient:
+    """Get the memory client for the current region (created on first use)."""
+    return _memory_client_for_region(_REGION)
+
+
+@functools.lru_cache(maxsize=1)
+def _memory_client_for_region(region: str) -> MemoryClient:
+    """Create one MemoryClient per process; a set_region() change rebuilds it."""
+    return MemoryClient(region_name=region)
+
+
+class _TTLCache:
+    """Thread-safe LRU cache whose entries also expire after ``ttl`` seconds."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+# Recent retrieve_memories results keyed on (region, query, fetch size). Agent
+# loops repeat the same recall often; memory_store clears it so new facts show
+# up. Limits are rounded up to a multiple of _RECALL_LIMIT_BUCKET before the
+# API call and results sliced afterwards, so the same query at limit 1, 3 or 10
+# shares one entry. Only non-empty results are cached, and only briefly: writes
+# are indexed asynchronously, other processes store without clearing this
+# cache, and MemoryClient reports API errors as an empty result.
+_recall_cache = _TTLCache(maxsize=256, ttl=30.0)
+_RECALL_LIMIT_BUCKET = 10
+
+# Concurrent Memory API calls issued by memory_store_batch / memory_recall_batch
+_MEMORY_BATCH_WORKERS = 4
 
 
 @tool
@@ -160,7 +386,55 @@ def memory_store(key: str, value: str, category: str = "general", max_retries: i
     """
     if not AGENTCORE_AVAILABLE:
         return "Error: bedrock-agentcore SDK not installed. Run: pip install bedrock-agentcore"
+    return _store(key, value, category, max_retries)
 
+
+@tool
+def memory_store_batch(items: list[dict], max_retries: int = 2) -> str:
+    """Store several facts in AgentCore long-term memory at once.
+
+    Each fact is its own Memory event (the key and category travel as event
+    metadata), so items are stored concurrently and the confirmations are
+    returned in input order.
+
+    Args:
+        items: Facts to store, each a dict with "key", "value" and optional
+            "category" (default: "general").
+        max_retries: Maximum retry attempts on transient errors (default: 2).
+
+    Returns:
+        One confirmation or error line per item.
+    """
+    if not AGENTCORE_AVAILABLE:
+        return "Error: bedrock-agentcore SDK not installed. Run: pip install bedrock-agentcore"
+
+    if not items:
+        return "Error: No items provided"
+
+    # Malformed items get an error line in their place; the others are still stored
+    problems = [_batch_item_error(index, item) for index, item in enumerate(items)]
+
+    def store_item(item: dict, problem: Optional[str]) -> str:
+        if problem:
+            return problem
+        return _store(item["key"], item["value"], item.get("category", "general"), max_retries)
+
+    with ThreadPoolExecutor(max_workers=min(_MEMORY_BATCH_WORKERS, len(items))) as pool:
+        return "\n".join(pool.map(store_item, items, problems))
+
+
+def _batch_item_error(index: int, item: Any) -> Optional[str]:
+    """Return an error line for a memory_store_batch item lacking "key" or "value"."""
+    if not isinstance(item, dict):
+        return f"Error: Item {index} is not an object with 'key' and 'value'"
+    missing = [field for field in ("key", "value") if field not in item]
+    if missing:
+        return f"Error: Item {index} is missing {' and '.join(repr(f) for f in missing)}"
+    return None
+
+
+def _store(key: str, value: str, category: str, max_retries: int) -> str:
+    """Store one memory event, shared by memory_store and the batch tool."""
     last_error = None
     for attempt in range(max_retries + 1):
         try:
@@ -194,26 +468,31 @@ def memory_store(key: str, value: str, category: str = "general", max_retries: i
                 metadata={"key": {"stringValue": key}, "category": {"stringValue": category}},
             )
             logger.info("Memory stored: %s=%s (category: %s)", key, value[:50], category)
+            _recall_cache.clear()
             return f"Stored memory '{key}' in category '{category}'"
 
         except Exception as e:
             last_error = e
-            error_msg = str(e)
+            error_code = _error_code(e)
             
-            if "ResourceNotFoundException" in error_msg:
+            if error_code == _NOT_FOUND:
                 return (
                     "Error: AgentCore Memory not provisioned. "
                     f"Create a memory store in AWS Bedrock Console first. Region: {_REGION}"
                 )
-            if "AccessDeniedException" in error_msg:
+            if error_code == _ACCESS_DENIED:
                 return (
                     "Error: No permission to use AgentCore Memory. "
                     "Ensure IAM role has bedrock-agentcore:* permissions."
                 )
             
             # Retry on transient errors
-            if attempt < max_retries and any(x in error_msg for x in ["Throttling", "ServiceUnavailable", "InternalError"]):
-                logger.warning("Memory store attempt %d failed (retrying): %s", attempt + 1, e)
+            if attempt < max_retries and error_code in _TRANSIENT_ERROR_CODES:
+                delay = _retry_delay(attempt)
+                logger.warning(
+                    "Memory store attempt %d failed (retrying in %.2fs): %s", attempt + 1, delay, e
+                )
+                time.sleep(delay)
                 continue
             
             logger.error("Memory store error: %s", e)
@@ -238,6 +517,42 @@ def memory_recall(query: str, limit: int = 5, max_retries: int = 2) -> str:
     """
     if not AGENTCORE_AVAILABLE:
         return "Error: bedrock-agentcore SDK not installed. Run: pip install bedrock-agentcore"
+    return _recall(query, limit, max_retries)
+
+
+@tool
+def memory_recall_batch(queries: list[str], limit: int = 5, max_retries: int = 2) -> str:
+    """Recall facts for several queries from AgentCore long-term memory at once.
+
+    The Memory API retrieves one query per call, so queries are issued
+    concurrently and the results are returned in input order.
+
+    Args:
+        queries: Search queries.
+        limit: Maximum number of results to return per query.
+        max_retries: Maximum retry attempts on transient errors (default: 2).
+
+    Returns:
+        Retrieved memories for each query, separated by blank lines.
+    """
+    if not AGENTCORE_AVAILABLE:
+        return "Error: bedrock-agentcore SDK not installed. Run: pip install bedrock-agentcore"
+
+    if not queries:
+        return "Error: No queries provided"
+
+    with ThreadPoolExecutor(max_workers=min(_MEMORY_BATCH_WORKERS, len(queries))) as pool:
+        results = pool.map(lambda q: _recall(q, limit, max_retries), queries)
+        return "\n\n".join(results)
+
+
+def _recall(query: str, limit: int, max_retries: int) -> str:
+    """Run one memory recall (cached), shared by memory_recall and the batch tool."""
+    fetch_size = -(-limit // _RECALL_LIMIT_BUCKET) * _RECALL_LIMIT_BUCKET
+    cache_key = (_REGION, query, fetch_size)
+    cached = _recall_cache.get(cache_key)
+    if cached is not None:
+        return _format_recall(query, cached[:limit])
 
     last_error = None
     for attempt in range(max_retries + 1):
@@ -264,42 +579,35 @@ def memory_recall(query: str, limit: int = 5, max_retries: int = 2) -> str:
                 memory_id=memory_id,
                 namespace="DEFAULT",
                 query=query,
-                top_k=limit,
+                top_k=fetch_size,
             )
-
-            if not results:
-                return f"No memories found for query: {query}"
-
-            output_lines = [f"Found {len(results)} memories for '{query}':"]
-            for i, result in enumerate(results, 1):
-                mem_content = result.get("content", {})
-                if isinstance(mem_content, dict):
-                    text = mem_content.get("text", str(result))
-                else:
-                    text = str(mem_content)
-                score = result.get("score", "N/A")
-                output_lines.append(f"  {i}. [{score}] {text}")
-
-            return "\n".join(output_lines)
+            results = tuple(results or ())
+            if results:
+                _recall_cache.put(cache_key, results)
+            return _format_recall(query, results[:limit])
 
         except Exception as e:
             last_error = e
-            error_msg = str(e)
+            error_code = _error_code(e)
             
-            if "ResourceNotFoundException" in error_msg:
+            if error_code == _NOT_FOUND:
                 return (
                     "Error: AgentCore Memory not provisioned. "
                     f"Create a memory store in AWS Bedrock Console first. Region: {_REGION}"
                 )
-            if "AccessDeniedException" in error_msg:
+            if error_code == _ACCESS_DENIED:
                 return (
                     "Error: No permission to use AgentCore Memory. "
                     "Ensure IAM role has bedrock-agentcore:* permissions."
                 )
             
             # Retry on transient errors
-            if attempt < max_retries and any(x in error_msg for x in ["Throttling", "ServiceUnavailable", "InternalError"]):
-                logger.warning("Memory recall attempt %d failed (retrying): %s", attempt + 1, e)
+            if attempt < max_retries and error_code in _TRANSIENT_ERROR_CODES:
+                delay = _retry_delay(attempt)
+                logger.warning(
+                    "Memory recall attempt %d failed (retrying in %.2fs): %s", attempt + 1, delay, e
+                )
+                time.sleep(delay)
                 continue
             
             logger.error("Memory recall error: %s", e)
@@ -308,6 +616,23 @@ def memory_recall(query: str, limit: int = 5, max_retries: int = 2) -> str:
     return f"Error recalling memory after {max_retries + 1} attempts: {last_error}"
 
 
+def _format_recall(query: str, results: tuple) -> str:
+    """Render retrieve_memories records as the memory_recall tool output."""
+    if not results:
+        return f"No memories found for query: {query}"
+
+    output_lines = [f"Found {len(results)} memories for '{query}':"]
+    for i, result in enumerate(results, 1):
+        mem_content = result.get("content", {})
+        if isinstance(mem_content, dict):
+            text = mem_content.get("text", str(result))
+        else:
+            text = str(mem_content)
+        score = result.get("score", "N/A")
+        output_lines.append(f"  {i}. [{score}] {text}")
+    return "\n".join(output_lines)
+
+
 @tool
 def code_execute(code: str, language: str = "python", timeout: int = 60) -> str:
     """Execute code in AgentCore sandboxed Code Interpreter.
@@ -374,13 +699,14 @@ def code_execute(code: str, language: str = "python", timeout: int = 60) -> str:
 
     except Exception as e:
         error_msg = str(e)
-        if "AccessDeniedException" in error_msg:
+        error_code = _error_code(e)
+        if error_code == _ACCESS_DENIED:
             return (
                 "Error: No permission to use AgentCore Code Interpreter. "
                 "Ensure IAM role has bedrock-agentcore:* permissions. "
                 f"Session: {session_id or 'not started'}"
             )
-        if "ResourceNotFoundException" in error_msg:
+        if error_code == _NOT_FOUND:
             return (
                 "Error: AgentCore Code Interpreter not provisioned. "
                 "Create a code interpreter in AWS Bedrock Console first. "
@@ -479,12 +805,12 @@ def kb_retrieve(query: str, knowledge_base_id: str = "") -> str:
         
     except ClientError as e:
         error_code = e.response["Error"]["Code"]
-        if error_code == "AccessDeniedException":
+        if error_code == _ACCESS_DENIED:
             return (
                 "Error: No permission to access Knowledge Base. "
                 "Ensure IAM role has bedrock:Retrieve permission."
             )
-        elif error_code == "ResourceNotFoundException":
+        elif error_code == _NOT_FOUND:
             return (
                 f"Error: Knowledge Base '{knowledge_base_id}' not found. "
                 "Verify Knowledge Base ID in config.yaml."
@@ -562,13 +888,14 @@ def web_search(query: str, num_results: int = 10, timeout: int = 30) -> str:
 
     except Exception as e:
         error_msg = str(e)
-        if "AccessDeniedException" in error_msg:
+        error_code = _error_code(e)
+        if error_code == _ACCESS_DENIED:
             return (
                 "Error: No permission to use AgentCore Browser. "
                 "Ensure IAM role has bedrock-agentcore:* permissions. "
                 f"Session: {session_id or 'not started'}"
             )
-        if "ResourceNotFoundException" in error_msg:
+        if error_code == _NOT_FOUND:
             return (
                 "Error: AgentCore Browser not provisioned. "
                 "Create a browser resource in AWS Bedrock Console first. "
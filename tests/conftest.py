@@ -7,6 +7,7 @@ Shared mock fixtures follow goldbergyoni R5 (stub/spy over mock)
 and R15 (no global seed — each fixture creates its own data).
 """
 
+import functools
 import unittest.mock
 from unittest.mock import MagicMock, patch
 
@@ -203,6 +204,37 @@ def tmp_workspace(tmp_path):
     return workspace
 
 
+# ---------------------------------------------------------------------------
+# AWS credential gate for @pytest.mark.aws tests
+# ---------------------------------------------------------------------------
+
+@functools.cache
+def _aws_credentials_available() -> bool:
+    """Resolve the botocore credential chain once per session.
+
+    Without credentials every AWS test would walk the full chain (env,
+    config files, SSO, IMDS) and time out individually before failing.
+    """
+    try:
+        import boto3
+    except ImportError:
+        return False
+    try:
+        return boto3.Session().get_credentials() is not None
+    except Exception:
+        return False
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip @pytest.mark.aws tests when no AWS credentials are configured."""
+    aws_items = [item for item in items if "aws" in item.keywords]
+    if not aws_items or _aws_credentials_available():
+        return
+    skip_no_creds = pytest.mark.skip(reason="AWS credentials not available")
+    for item in aws_items:
+        item.add_marker(skip_no_creds)
+
+
 # ---------------------------------------------------------------------------
 # Issue #73: テスト有効性の可視化（skip率監視）
 # ---------------------------------------------------------------------------
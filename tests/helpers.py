@@ -7,18 +7,48 @@ Usage:
     from tests.helpers import assert_bedrock_called_with_model, assert_valid_config
 """
 
+import functools
+import re
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import yaml
+
+# libyaml-backed parser / emitter when PyYAML was built with it
+YamlSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+_SENSITIVE_PATTERNS = (
+    "AWS_ACCESS_KEY",
+    "AWS_SECRET",
+    "SLACK_BOT_TOKEN",
+    "password",
+    "BEGIN RSA PRIVATE KEY",
+)
+# Patterns are case-folded once here; the output is lowered once per call.
+_SENSITIVE_LOWER = {p.lower(): p for p in _SENSITIVE_PATTERNS}
+
+
+@functools.cache
+def _sensitive_re() -> re.Pattern[str]:
+    """Single alternation over the lowercased patterns, compiled on first use.
+
+    One pass over the output instead of one substring scan per pattern.
+    """
+    return re.compile("|".join(map(re.escape, _SENSITIVE_LOWER)))
+
 
 def assert_bedrock_called_with_model(mock_client, model_id: str) -> None:
     """Assert that Bedrock client was called with the expected model ID.
 
     Checks the behavioral contract (R4: black-box testing, TW5: structural decoupling).
     """
-    mock_client.converse.assert_called()
-    call_kwargs = mock_client.converse.call_args
-    assert call_kwargs is not None, "Bedrock client.converse was not called"
-    assert call_kwargs.kwargs.get("modelId") == model_id or \
-           (call_kwargs.args and call_kwargs.args[0] == model_id), \
-           f"Expected model_id={model_id}, got call_args={call_kwargs}"
+    call_args = mock_client.converse.call_args
+    assert call_args is not None, "Bedrock client.converse was not called"
+    if call_args.kwargs.get("modelId") == model_id:
+        return
+    assert call_args.args and call_args.args[0] == model_id, \
+        f"Expected model_id={model_id}, got call_args={call_args}"
 
 
 def assert_valid_config(config: dict) -> None:
@@ -32,16 +62,9 @@ def assert_valid_config(config: dict) -> None:
 
 def assert_shell_output_safe(output: str) -> None:
     """Assert that shell command output contains no sensitive data."""
-    sensitive_patterns = [
-        "AWS_ACCESS_KEY",
-        "AWS_SECRET",
-        "SLACK_BOT_TOKEN",
-        "password",
-        "BEGIN RSA PRIVATE KEY",
-    ]
-    for pattern in sensitive_patterns:
-        assert pattern.lower() not in output.lower(), \
-            f"Shell output contains sensitive pattern: {pattern}"
+    match = _sensitive_re().search(output.lower())
+    assert match is None, \
+        f"Shell output contains sensitive pattern: {_SENSITIVE_LOWER[match.group()]}"
 
 
 def assert_test_follows_aaa(test_source: str) -> None:
@@ -49,7 +72,37 @@ def assert_test_follows_aaa(test_source: str) -> None:
 
     Simple heuristic: looks for blank line separations between sections.
     """
-    lines = test_source.strip().split('\n')
-    non_empty = [l for l in lines if l.strip()]
-    # At least 3 logical sections
-    assert len(non_empty) >= 3, "Test should have at least Arrange, Act, and Assert sections"
+    # At least 3 logical sections; stop scanning as soon as we have them
+    non_empty = 0
+    for line in test_source.splitlines():
+        if line.strip():
+            non_empty += 1
+            if non_empty >= 3:
+                return
+    raise AssertionError("Test should have at least Arrange, Act, and Assert sections")
+
+
+def cm(inner=None, *, enter_error: Exception | None = None) -> MagicMock:
+    """Build a context-manager mock whose ``__enter__`` yields ``inner``.
+
+    ``enter_error`` makes ``__enter__`` raise instead (e.g. session start denied).
+    ``__exit__`` returns False so exceptions inside the block propagate.
+    """
+    manager = MagicMock()
+    manager.__enter__.return_value = inner
+    if enter_error is not None:
+        manager.__enter__.side_effect = enter_error
+    manager.__exit__.return_value = False
+    return manager
+
+
+def load_yaml(path: Path):
+    """Parse the YAML document at ``path`` with the safe loader."""
+    return yaml.load(path.read_bytes(), YamlSafeLoader)
+
+
+def dump_yaml(path: Path, data) -> None:
+    """Write ``data`` to ``path`` as block-style YAML in a single write."""
+    path.write_bytes(
+        yaml.dump(data, Dumper=_YamlDumper, default_flow_style=False, encoding="utf-8")
+    )
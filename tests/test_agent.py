@@ -1,94 +1,114 @@
 """Tests for yui.agent — AC-02, AC-04, AC-05."""
 
+import copy
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import pytest
 
 from yui.config import load_config
-from yui.agent import create_agent, _load_system_prompt
+from yui.agent import create_agent, tool_names, _load_system_prompt
 
 pytestmark = pytest.mark.component
 
 
 
 class TestSystemPrompt:
-    """AC-05: System prompt includes content from AGENTS.md and SOUL.md."""
+    """AC-05: System prompt includes content from AGENTS.md and SOUL.md.
 
-    def test_loads_both_files(self, tmp_path):
+    Workspace files live on an in-memory pyfakefs filesystem (``fs`` fixture).
+    """
+
+    WORKSPACE = Path("/ws")
+
+    def test_loads_both_files(self, fs):
         """Both AGENTS.md and SOUL.md are concatenated into system prompt."""
-        agents = tmp_path / "AGENTS.md"
-        soul = tmp_path / "SOUL.md"
-        agents.write_text("# Agent Rules\nBe safe.")
-        soul.write_text("# Persona\nI am Yui.")
+        fs.create_file(self.WORKSPACE / "AGENTS.md", contents="# Agent Rules\nBe safe.")
+        fs.create_file(self.WORKSPACE / "SOUL.md", contents="# Persona\nI am Yui.")
 
-        prompt = _load_system_prompt(tmp_path)
+        prompt = _load_system_prompt(self.WORKSPACE)
         assert "Agent Rules" in prompt
         assert "Be safe" in prompt
         assert "Persona" in prompt
         assert "I am Yui" in prompt
 
-    def test_missing_agents_md(self, tmp_path):
+    def test_missing_agents_md(self, fs):
         """Missing AGENTS.md → still works, just SOUL.md."""
-        soul = tmp_path / "SOUL.md"
-        soul.write_text("# Persona\nI am Yui.")
+        fs.create_file(self.WORKSPACE / "SOUL.md", contents="# Persona\nI am Yui.")
 
-        prompt = _load_system_prompt(tmp_path)
+        prompt = _load_system_prompt(self.WORKSPACE)
         assert "I am Yui" in prompt
 
-    def test_missing_both(self, tmp_path):
+    def test_missing_both(self, fs):
         """Both missing → falls back to DEFAULT_SYSTEM_PROMPT (no crash, no empty string)."""
         from yui.agent import DEFAULT_SYSTEM_PROMPT
-        prompt = _load_system_prompt(tmp_path)
+        fs.create_dir(self.WORKSPACE)
+        prompt = _load_system_prompt(self.WORKSPACE)
         assert prompt == DEFAULT_SYSTEM_PROMPT
 
-    def test_load_system_prompt_empty_returns_default(self, tmp_path):
+    def test_load_system_prompt_empty_returns_default(self, fs):
         """Both AGENTS.md and SOUL.md absent → returns DEFAULT_SYSTEM_PROMPT (Issue #95)."""
         from yui.agent import DEFAULT_SYSTEM_PROMPT
-        prompt = _load_system_prompt(tmp_path)
+        fs.create_dir(self.WORKSPACE)
+        prompt = _load_system_prompt(self.WORKSPACE)
         assert prompt == DEFAULT_SYSTEM_PROMPT
         assert prompt == "You are Yui, a helpful AI assistant."
 
-    def test_load_system_prompt_empty_not_empty_string(self, tmp_path):
+    def test_load_system_prompt_empty_not_empty_string(self, fs):
         """Both files absent → must NOT return empty string (Issue #95 regression guard)."""
-        prompt = _load_system_prompt(tmp_path)
+        fs.create_dir(self.WORKSPACE)
+        prompt = _load_system_prompt(self.WORKSPACE)
         assert prompt != ""
         assert len(prompt) > 0
 
+    def test_crlf_files_use_lf_newlines(self, fs):
+        """CRLF-encoded prompt files are read with universal newlines."""
+        fs.create_file(self.WORKSPACE / "AGENTS.md", contents=b"# Agent Rules\r\nBe safe.\r\n")
+
+        prompt = _load_system_prompt(self.WORKSPACE)
+        assert "\r" not in prompt
+        assert prompt == "# Agent Rules\nBe safe.\n"
+
+    def test_reloads_after_file_change(self, fs):
+        """Cached prompt is invalidated when AGENTS.md changes."""
+        agents = fs.create_file(self.WORKSPACE / "AGENTS.md", contents="first")
+        assert _load_system_prompt(self.WORKSPACE) == "first"
+
+        agents.set_contents("second version")
+        assert _load_system_prompt(self.WORKSPACE) == "second version"
+
+
+@pytest.fixture(scope="module")
+def base_config():
+    """Default config, loaded once per module; tests deep-copy before mutating."""
+    return load_config("/nonexistent/yui-config.yaml")
+
+
+@pytest.fixture(scope="module")
+def base_agent(base_config, tmp_path_factory):
+    """One agent over a workspace with both prompt files; tests treat it as read-only."""
+    workspace = tmp_path_factory.mktemp("ws")
+    (workspace / "AGENTS.md").write_text("UNIQUE_AGENTS_TOKEN")
+    (workspace / "SOUL.md").write_text("UNIQUE_SOUL_TOKEN")
+
+    config = copy.deepcopy(base_config)
+    config["tools"]["file"]["workspace_root"] = str(workspace)
+    return create_agent(config)
+
 
 class TestCreateAgent:
     """AC-02: Agent is created with BedrockModel.
     AC-04: file_read, file_write, editor tools are registered.
     """
 
-    def test_agent_has_correct_tools(self, tmp_path):
+    def test_agent_has_correct_tools(self, base_agent):
         """Agent registers safe_shell, file_read, file_write, editor."""
-        # Set up workspace
-        agents = tmp_path / "AGENTS.md"
-        agents.write_text("# Rules")
-
-        config = load_config(str(tmp_path / "nonexistent.yaml"))
-        config["tools"]["file"]["workspace_root"] = str(tmp_path)
+        names = tool_names(base_agent)
 
-        agent = create_agent(config)
-        tool_names = list(agent.tool_registry.registry.keys())
+        expected = {"safe_shell", "file_read", "file_write", "editor"}
+        assert expected <= names, f"Missing: {expected - names}, tools: {sorted(names)}"
 
-        assert "safe_shell" in tool_names, f"Tools: {tool_names}"
-        assert "file_read" in tool_names, f"Tools: {tool_names}"
-        assert "file_write" in tool_names, f"Tools: {tool_names}"
-        assert "editor" in tool_names, f"Tools: {tool_names}"
-
-    def test_agent_system_prompt_loaded(self, tmp_path):
+    def test_agent_system_prompt_loaded(self, base_agent):
         """Agent's system prompt contains workspace file content."""
-        agents = tmp_path / "AGENTS.md"
-        soul = tmp_path / "SOUL.md"
-        agents.write_text("UNIQUE_AGENTS_TOKEN")
-        soul.write_text("UNIQUE_SOUL_TOKEN")
-
-        config = load_config(str(tmp_path / "nonexistent.yaml"))
-        config["tools"]["file"]["workspace_root"] = str(tmp_path)
-
-        agent = create_agent(config)
-
-        assert "UNIQUE_AGENTS_TOKEN" in agent.system_prompt
-        assert "UNIQUE_SOUL_TOKEN" in agent.system_prompt
+        assert "UNIQUE_AGENTS_TOKEN" in base_agent.system_prompt
+        assert "UNIQUE_SOUL_TOKEN" in base_agent.system_prompt
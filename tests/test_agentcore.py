@@ -1,73 +1,212 @@
 """Tests for AgentCore tools — AC-17, AC-18, AC-18a."""
 
-from unittest.mock import MagicMock, patch, PropertyMock
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
-
-from yui.tools.agentcore import code_execute, memory_recall, memory_store, web_browse
+from botocore.exceptions import ClientError
+
+from yui.tools import agentcore
+from yui.tools.agentcore import (
+    code_execute,
+    memory_recall,
+    memory_recall_batch,
+    memory_store,
+    memory_store_batch,
+    web_browse,
+)
 
 pytestmark = pytest.mark.component
 
 
+def aws_error(code: str, operation: str = "Operation") -> ClientError:
+    """Build the botocore ClientError the AgentCore SDK raises for ``code``."""
+    return ClientError({"Error": {"Code": code, "Message": f"{code} raised"}}, operation)
 
-# --- web_browse ---
 
-@patch("yui.tools.agentcore.AGENTCORE_AVAILABLE", True)
-@patch("yui.tools.agentcore.PLAYWRIGHT_AVAILABLE", True)
-@patch("yui.tools.agentcore.sync_playwright", create=True)
-@patch("yui.tools.agentcore.browser_session")
-def test_web_browse(mock_session, mock_playwright) -> None:
-    """AC-17: Web browse via AgentCore Browser + Playwright."""
-    mock_browser_client = MagicMock()
-    mock_browser_client.session_id = "session-123"
-    mock_browser_client.generate_ws_headers.return_value = (
-        "wss://example.com/browser", {"Authorization": "SigV4 xxx"}
+# --- shared SDK fakes ---
+
+class FakeBrowserContext:
+    """Playwright browser context stub counting cookie resets."""
+
+    def __init__(self) -> None:
+        self.clear_cookies_calls = 0
+
+    def clear_cookies(self) -> None:
+        self.clear_cookies_calls += 1
+
+
+class FakePage:
+    """Playwright page stub exposing only what web_browse calls."""
+
+    def __init__(self) -> None:
+        self.content_text = ""
+        self.goto_error: Exception | None = None
+        self.visited: list[str] = []
+        self.context = FakeBrowserContext()
+
+    def goto(self, url: str, timeout: int | None = None) -> None:
+        if self.goto_error is not None:
+            raise self.goto_error
+        self.visited.append(url)
+
+    def content(self) -> str:
+        return self.content_text
+
+
+class FakePwBrowser:
+    """CDP-connected browser stub with a single context holding one page."""
+
+    def __init__(self, page: FakePage) -> None:
+        self.contexts = [SimpleNamespace(pages=[page])]
+        self.close_calls = 0
+
+    def new_page(self) -> FakePage:
+        return self.contexts[0].pages[0]
+
+    def close(self) -> None:
+        self.close_calls += 1
+
+
+class FakePlaywright:
+    """Stand-in for the ``sync_playwright()`` context manager."""
+
+    def __init__(self, browser: FakePwBrowser) -> None:
+        self.chromium = SimpleNamespace(connect_over_cdp=lambda *args, **kwargs: browser)
+
+    def __enter__(self) -> "FakePlaywright":
+        return self
+
+    def __exit__(self, *exc_info) -> bool:
+        return False
+
+
+class AgentCoreMocks:
+    """Fake AgentCore SDK / Playwright graph wired for the happy path.
+
+    Built fresh for every test; tests override only what they exercise.
+    """
+
+    def __init__(self) -> None:
+        self.browser_client = MagicMock(session_id="session-123")
+        self.browser_client.generate_ws_headers.return_value = (
+            "wss://example.com/browser", {"Authorization": "SigV4 xxx"}
+        )
+        self.browser_client_cls = MagicMock(return_value=self.browser_client)
+
+        self.page = FakePage()
+        self.pw_browser = FakePwBrowser(self.page)
+
+        self.memory_client = MagicMock()
+        self.memory_client.create_or_get_memory.return_value = {"memoryId": "mem-123"}
+
+        self.interpreter = MagicMock()
+        self.code_session = MagicMock()
+        self.code_session.return_value.__enter__.return_value = self.interpreter
+        self.code_session.return_value.__exit__.return_value = False
+
+
+@pytest.fixture
+def ac_mocks(monkeypatch):
+    """Install fresh fakes into yui.tools.agentcore with the SDK marked available."""
+    mocks = AgentCoreMocks()
+    # Retry backoff collapses to zero-length sleeps
+    monkeypatch.setattr(agentcore, "_RETRY_BACKOFF_BASE", 0.0)
+    monkeypatch.setattr(agentcore, "_recall_cache", agentcore._TTLCache(maxsize=256, ttl=30.0))
+    monkeypatch.setattr(
+        agentcore, "_browser_pool",
+        agentcore._BrowserPool(agentcore._BROWSER_MAX_SESSIONS, agentcore._BROWSER_SESSION_IDLE_TTL),
     )
-    mock_session.return_value.__enter__ = MagicMock(return_value=mock_browser_client)
-    mock_session.return_value.__exit__ = MagicMock(return_value=False)
+    monkeypatch.setattr(agentcore, "AGENTCORE_AVAILABLE", True)
+    monkeypatch.setattr(agentcore, "PLAYWRIGHT_AVAILABLE", True)
+    monkeypatch.setattr(agentcore, "BrowserClient", mocks.browser_client_cls, raising=False)
+    monkeypatch.setattr(
+        agentcore, "sync_playwright", lambda: FakePlaywright(mocks.pw_browser), raising=False
+    )
+    monkeypatch.setattr(agentcore, "code_session", mocks.code_session, raising=False)
+    monkeypatch.setattr(agentcore, "_get_memory_client", lambda: mocks.memory_client)
+    return mocks
+
+
+# --- web_browse ---
 
-    mock_page = MagicMock()
-    mock_page.content.return_value = "Example content from page"
-    mock_pw_browser = MagicMock()
-    mock_pw_browser.contexts = [MagicMock(pages=[mock_page])]
-    mock_playwright.return_value.__enter__.return_value.chromium.connect_over_cdp.return_value = mock_pw_browser
+def test_web_browse(ac_mocks) -> None:
+    """AC-17: Web browse via AgentCore Browser + Playwright."""
+    ac_mocks.page.content_text = "Example content from page"
 
     result = web_browse(url="https://example.com", task="extract content")
     assert "Example content from page" in result
 
 
-@patch("yui.tools.agentcore.AGENTCORE_AVAILABLE", False)
-def test_web_browse_unavailable() -> None:
-    """Web browse when SDK not installed."""
-    result = web_browse(url="https://example.com")
-    assert "Error" in result
-    assert "not installed" in result
+def test_web_browse_reuses_browser_session(ac_mocks) -> None:
+    """Consecutive calls share one AgentCore session; only the CDP connection is closed."""
+    ac_mocks.page.content_text = "content"
 
+    web_browse(url="https://example.com/a")
+    web_browse(url="https://example.com/b")
 
-@patch("yui.tools.agentcore.AGENTCORE_AVAILABLE", True)
-@patch("yui.tools.agentcore.PLAYWRIGHT_AVAILABLE", True)
-@patch("yui.tools.agentcore.browser_session")
-def test_web_browse_permission_denied(mock_session) -> None:
-    """Web browse with AccessDeniedException."""
-    mock_session.return_value.__enter__ = MagicMock(
-        side_effect=Exception("AccessDeniedException: User is not authorized")
-    )
-    mock_session.return_value.__exit__ = MagicMock(return_value=False)
+    ac_mocks.browser_client.start.assert_called_once()
+    ac_mocks.browser_client.stop.assert_not_called()
+    assert ac_mocks.pw_browser.close_calls == 2
+    assert (agentcore._browser_pool.created, agentcore._browser_pool.reused) == (1, 1)
+
+
+def test_web_browse_restarts_idle_expired_session(ac_mocks, monkeypatch) -> None:
+    """A pooled session idle past the TTL is stopped instead of being reused."""
+    monkeypatch.setattr(agentcore._browser_pool, "idle_ttl", 0.0)
+
+    web_browse(url="https://example.com/a")
+    web_browse(url="https://example.com/b")
+
+    assert ac_mocks.browser_client.start.call_count == 2
+    assert ac_mocks.browser_client.stop.call_count == 2
+    assert agentcore._browser_pool.reused == 0
 
-    result = web_browse(url="https://example.com")
-    assert "No permission" in result
+
+def test_web_browse_resets_page_before_pooling(ac_mocks) -> None:
+    """A pooled session is handed back blank, with the previous visit's cookies cleared."""
+    web_browse(url="https://example.com/login")
+
+    assert ac_mocks.page.visited == ["https://example.com/login", "about:blank"]
+    assert ac_mocks.page.context.clear_cookies_calls == 1
+    assert agentcore._browser_pool.idle_count() == 1
+
+
+def test_web_browse_stops_session_when_reset_fails(ac_mocks, monkeypatch) -> None:
+    """A session whose state could not be cleared is stopped, not pooled; the content is kept."""
+    ac_mocks.page.content_text = "content"
+
+    def fail_clear_cookies() -> None:
+        raise RuntimeError("Target closed")
+
+    monkeypatch.setattr(ac_mocks.page.context, "clear_cookies", fail_clear_cookies)
+
+    assert web_browse(url="https://example.com") == "content"
+    ac_mocks.browser_client.stop.assert_called_once()
+    assert agentcore._browser_pool.idle_count() == 0
+
+
+def test_browser_pool_caps_concurrent_sessions(ac_mocks) -> None:
+    """Checked-out sessions are capped at max_sessions; a released one is reused."""
+    pool = agentcore._BrowserPool(max_sessions=2, idle_ttl=300.0)
+    first = pool.acquire(None)
+    pool.acquire(None)
+    assert pool.active == 2
+
+    with pytest.raises(TimeoutError):
+        pool.acquire(None, timeout=0.01)
+
+    pool.release(first, None)
+    assert pool.acquire(None, timeout=0.01) is first
+    assert (pool.created, pool.reused, pool.active) == (2, 1, 2)
 
 
 # --- memory_store ---
 
-@patch("yui.tools.agentcore.AGENTCORE_AVAILABLE", True)
-@patch("yui.tools.agentcore._get_memory_client")
-def test_memory_store(mock_get_client) -> None:
+def test_memory_store(ac_mocks) -> None:
     """AC-18: Memory store via AgentCore Memory (new SDK API)."""
-    mock_client = MagicMock()
-    mock_client.create_or_get_memory.return_value = {"memoryId": "mem-123"}
+    mock_client = ac_mocks.memory_client
     mock_client.create_event.return_value = {"eventId": "evt-456"}
-    mock_get_client.return_value = mock_client
 
     result = memory_store(key="preference", value="dark mode", category="user")
     assert "Stored" in result
@@ -76,90 +215,235 @@ def test_memory_store(mock_get_client) -> None:
     mock_client.create_event.assert_called_once()
 
 
-@patch("yui.tools.agentcore.AGENTCORE_AVAILABLE", False)
-def test_memory_store_unavailable() -> None:
-    """Memory store when SDK not installed."""
-    result = memory_store(key="k", value="v")
+def test_memory_store_batch(ac_mocks) -> None:
+    """Batch store writes one event per item and confirms each, in input order."""
+    items = [{"key": f"bulk_{i}", "value": f"item {i}", "category": "perf"} for i in range(6)]
+    items.append({"key": "plain", "value": "no category"})
+
+    result = memory_store_batch(items=items)
+
+    lines = result.splitlines()
+    assert lines[:6] == [f"Stored memory 'bulk_{i}' in category 'perf'" for i in range(6)]
+    assert lines[6] == "Stored memory 'plain' in category 'general'"
+    assert ac_mocks.memory_client.create_event.call_count == 7
+
+
+def test_memory_store_batch_malformed_items(ac_mocks) -> None:
+    """Items without key/value get an error line; the valid ones are still stored."""
+    items = [{"key": "ok", "value": "v"}, {"value": "no key"}, {"key": "no value"}, "text"]
+
+    result = memory_store_batch(items=items)
+
+    assert result.splitlines() == [
+        "Stored memory 'ok' in category 'general'",
+        "Error: Item 1 is missing 'key'",
+        "Error: Item 2 is missing 'value'",
+        "Error: Item 3 is not an object with 'key' and 'value'",
+    ]
+    ac_mocks.memory_client.create_event.assert_called_once()
+
+
+def test_memory_store_batch_empty(ac_mocks) -> None:
+    """Batch store with no items returns an error without calling the API."""
+    result = memory_store_batch(items=[])
     assert "Error" in result
-    assert "not installed" in result
+    ac_mocks.memory_client.create_event.assert_not_called()
+
+
+@pytest.fixture
+def fresh_memory_client_cache():
+    agentcore._memory_client_for_region.cache_clear()
+    yield
+    agentcore._memory_client_for_region.cache_clear()
+
+
+def test_memory_client_reused_per_region(fresh_memory_client_cache, monkeypatch) -> None:
+    """_get_memory_client builds one client per region and reuses it."""
+    memory_client_cls = MagicMock(side_effect=lambda region_name: MagicMock(region=region_name))
+    monkeypatch.setattr(agentcore, "MemoryClient", memory_client_cls, raising=False)
+    monkeypatch.setattr(agentcore, "_REGION", "us-east-1")
+
+    first = agentcore._get_memory_client()
+    assert agentcore._get_memory_client() is first
+
+    monkeypatch.setattr(agentcore, "_REGION", "us-west-2")
+    second = agentcore._get_memory_client()
+    assert second is not first
+    assert second.region == "us-west-2"
+    assert memory_client_cls.call_count == 2
 
 
 # --- memory_recall ---
 
-@patch("yui.tools.agentcore.AGENTCORE_AVAILABLE", True)
-@patch("yui.tools.agentcore._get_memory_client")
-def test_memory_recall(mock_get_client) -> None:
+def test_memory_recall(ac_mocks) -> None:
     """AC-18: Memory recall via AgentCore Memory (new SDK API)."""
-    mock_client = MagicMock()
-    mock_client.create_or_get_memory.return_value = {"memoryId": "mem-123"}
-    mock_client.retrieve_memories.return_value = [
+    ac_mocks.memory_client.retrieve_memories.return_value = [
         {"content": {"text": "dark mode preference"}, "score": 0.95},
     ]
-    mock_get_client.return_value = mock_client
 
     result = memory_recall(query="user preference", limit=5)
     assert "dark mode" in result
     assert "1 memories" in result
 
 
-@patch("yui.tools.agentcore.AGENTCORE_AVAILABLE", True)
-@patch("yui.tools.agentcore._get_memory_client")
-def test_memory_recall_empty(mock_get_client) -> None:
+def test_memory_recall_empty(ac_mocks) -> None:
     """Memory recall with no results (new SDK API)."""
-    mock_client = MagicMock()
-    mock_client.create_or_get_memory.return_value = {"memoryId": "mem-123"}
-    mock_client.retrieve_memories.return_value = []
-    mock_get_client.return_value = mock_client
+    ac_mocks.memory_client.retrieve_memories.return_value = []
 
     result = memory_recall(query="nonexistent")
     assert "No memories found" in result
 
 
-@patch("yui.tools.agentcore.AGENTCORE_AVAILABLE", False)
-def test_memory_recall_unavailable() -> None:
-    """Memory recall when SDK not installed."""
-    result = memory_recall(query="test")
+@pytest.mark.parametrize("query", ["", "x"], ids=["empty", "single-char"])
+def test_memory_recall_edge_case_queries(ac_mocks, query) -> None:
+    """Empty / minimal queries are sent to the Memory API as-is, with the bucketed top_k."""
+    ac_mocks.memory_client.retrieve_memories.return_value = []
+
+    memory_recall(query=query, limit=1)
+
+    kwargs = ac_mocks.memory_client.retrieve_memories.call_args.kwargs
+    assert (kwargs["query"], kwargs["top_k"]) == (query, agentcore._RECALL_LIMIT_BUCKET)
+
+
+def test_memory_recall_batch(ac_mocks) -> None:
+    """Batch recall returns one section per query, in input order."""
+    queries = [f"topic-{i}" for i in range(5)]
+    ac_mocks.memory_client.retrieve_memories.side_effect = lambda **kw: [
+        {"content": {"text": f"fact about {kw['query']}"}, "score": 0.9},
+    ]
+
+    result = memory_recall_batch(queries=queries, limit=3)
+
+    sections = result.split("\n\n")
+    assert len(sections) == 5
+    for query, section in zip(queries, sections, strict=True):
+        assert f"fact about {query}" in section
+    assert ac_mocks.memory_client.retrieve_memories.call_count == 5
+
+
+def test_memory_recall_batch_empty(ac_mocks) -> None:
+    """Batch recall with no queries returns an error without calling the API."""
+    result = memory_recall_batch(queries=[])
     assert "Error" in result
-    assert "not installed" in result
+    ac_mocks.memory_client.retrieve_memories.assert_not_called()
+
+
+def test_memory_recall_cached(ac_mocks) -> None:
+    """Repeated recall of the same query is served from the result cache."""
+    ac_mocks.memory_client.retrieve_memories.return_value = [
+        {"content": {"text": "dark mode preference"}, "score": 0.95},
+    ]
+
+    first = memory_recall(query="user preference", limit=5)
+    second = memory_recall(query="user preference", limit=5)
+
+    assert second == first
+    assert ac_mocks.memory_client.retrieve_memories.call_count == 1
+
+
+def test_memory_recall_limits_share_cache_entry(ac_mocks) -> None:
+    """Limits within one bucket are sliced from a single retrieve_memories call."""
+    ac_mocks.memory_client.retrieve_memories.return_value = [
+        {"content": {"text": f"fact {i}"}, "score": 0.9} for i in range(10)
+    ]
+
+    results = [memory_recall(query="limits", limit=n) for n in (1, 3, 10)]
+
+    assert [r.splitlines()[0] for r in results] == [
+        "Found 1 memories for 'limits':",
+        "Found 3 memories for 'limits':",
+        "Found 10 memories for 'limits':",
+    ]
+    ac_mocks.memory_client.retrieve_memories.assert_called_once()
+    assert ac_mocks.memory_client.retrieve_memories.call_args.kwargs["top_k"] == 10
+    assert (agentcore._recall_cache.misses, agentcore._recall_cache.hits) == (1, 2)
+
+
+def test_memory_recall_does_not_cache_empty_result(ac_mocks) -> None:
+    """An empty result (not indexed yet, or a swallowed API error) is fetched again."""
+    ac_mocks.memory_client.retrieve_memories.return_value = []
+    assert "No memories found" in memory_recall(query="theme")
+
+    ac_mocks.memory_client.retrieve_memories.return_value = [
+        {"content": {"text": "theme = dark"}, "score": 0.9},
+    ]
+
+    assert "theme = dark" in memory_recall(query="theme")
+    assert ac_mocks.memory_client.retrieve_memories.call_count == 2
+
+
+def test_memory_store_invalidates_recall_cache(ac_mocks) -> None:
+    """A successful store drops cached recall results."""
+    ac_mocks.memory_client.retrieve_memories.return_value = [
+        {"content": {"text": "theme = light"}, "score": 0.9},
+    ]
+    memory_recall(query="theme")
+
+    memory_store(key="theme", value="dark")
+    ac_mocks.memory_client.retrieve_memories.return_value = [
+        {"content": {"text": "theme = dark"}, "score": 0.9},
+    ]
+
+    assert "theme = dark" in memory_recall(query="theme")
+    assert ac_mocks.memory_client.retrieve_memories.call_count == 2
+
+
+def test_retry_delay_grows_exponentially_with_jitter(monkeypatch) -> None:
+    """Backoff window doubles per attempt, is capped, and never goes negative."""
+    monkeypatch.setattr(agentcore.random, "uniform", lambda low, high: high)
+    assert [agentcore._retry_delay(n) for n in range(6)] == [0.5, 1.0, 2.0, 4.0, 8.0, 8.0]
+
+    monkeypatch.setattr(agentcore.random, "uniform", lambda low, high: low)
+    assert agentcore._retry_delay(3) == 0
 
 
 # --- code_execute ---
 
-@patch("yui.tools.agentcore.AGENTCORE_AVAILABLE", True)
-@patch("yui.tools.agentcore.code_session")
-def test_code_execute(mock_session) -> None:
+def test_code_execute(ac_mocks) -> None:
     """AC-18a: Code execution via AgentCore Code Interpreter."""
-    mock_interpreter = MagicMock()
-    mock_interpreter.start.return_value = "session-456"
-    mock_interpreter.execute_code.return_value = {
+    ac_mocks.interpreter.start.return_value = "session-456"
+    ac_mocks.interpreter.execute_code.return_value = {
         "stdout": "hello\n",
         "stderr": "",
     }
-    mock_session.return_value.__enter__ = MagicMock(return_value=mock_interpreter)
-    mock_session.return_value.__exit__ = MagicMock(return_value=False)
 
     result = code_execute(code="print('hello')", language="python")
     assert "hello" in result
 
 
-@patch("yui.tools.agentcore.AGENTCORE_AVAILABLE", False)
-def test_code_execute_unavailable() -> None:
-    """Code execute when SDK not installed."""
-    result = code_execute(code="print('hello')")
+@pytest.mark.parametrize(
+    ("tool", "kwargs"),
+    [
+        (web_browse, {"url": "https://example.com"}),
+        (memory_store, {"key": "k", "value": "v"}),
+        (memory_store_batch, {"items": [{"key": "k", "value": "v"}]}),
+        (memory_recall, {"query": "test"}),
+        (memory_recall_batch, {"queries": ["test"]}),
+        (code_execute, {"code": "print('hello')"}),
+    ],
+    ids=["web_browse", "memory_store", "memory_store_batch", "memory_recall", "memory_recall_batch", "code_execute"],
+)
+def test_tool_unavailable(tool, kwargs, monkeypatch) -> None:
+    """Every AgentCore tool reports a missing SDK instead of raising."""
+    monkeypatch.setattr(agentcore, "AGENTCORE_AVAILABLE", False)
+    result = tool(**kwargs)
     assert "Error" in result
     assert "not installed" in result
 
 
-@patch("yui.tools.agentcore.AGENTCORE_AVAILABLE", True)
-@patch("yui.tools.agentcore.code_session")
-def test_code_execute_permission_denied(mock_session) -> None:
-    """Code execute with AccessDeniedException."""
-    mock_session.return_value.__enter__ = MagicMock(
-        side_effect=Exception("AccessDeniedException: No access")
-    )
-    mock_session.return_value.__exit__ = MagicMock(return_value=False)
+@pytest.mark.parametrize(
+    ("session_start", "call"),
+    [
+        (lambda m: m.browser_client.start, lambda: web_browse(url="https://example.com")),
+        (lambda m: m.code_session.return_value.__enter__, lambda: code_execute(code="print('hello')")),
+    ],
+    ids=["web_browse", "code_execute"],
+)
+def test_session_permission_denied(ac_mocks, session_start, call) -> None:
+    """Browser / Code Interpreter sessions surface AccessDeniedException as 'No permission'."""
+    session_start(ac_mocks).side_effect = aws_error("AccessDeniedException", "StartSession")
 
-    result = code_execute(code="print('hello')")
+    result = call()
     assert "No permission" in result
 
 
@@ -167,73 +451,45 @@ def test_code_execute_permission_denied(mock_session) -> None:
 # Issue #74: 異常系・境界値テスト追加
 # ──────────────────────────────────────────────
 
-@patch("yui.tools.agentcore.AGENTCORE_AVAILABLE", True)
-@patch("yui.tools.agentcore.PLAYWRIGHT_AVAILABLE", True)
-@patch("yui.tools.agentcore.sync_playwright", create=True)
-@patch("yui.tools.agentcore.browser_session")
-def test_web_browse_timeout(mock_session, mock_playwright) -> None:
+def test_web_browse_timeout(ac_mocks) -> None:
     """web_browse returns error message when page.goto raises an exception (e.g. timeout)."""
-    mock_browser_client = MagicMock()
-    mock_browser_client.session_id = "session-123"
-    mock_browser_client.generate_ws_headers.return_value = (
-        "wss://example.com/browser", {"Authorization": "SigV4 xxx"}
-    )
-    mock_session.return_value.__enter__ = MagicMock(return_value=mock_browser_client)
-    mock_session.return_value.__exit__ = MagicMock(return_value=False)
-
-    mock_page = MagicMock()
-    mock_page.goto.side_effect = Exception("Timeout: page.goto exceeded 30s")
-    mock_pw_browser = MagicMock()
-    mock_pw_browser.contexts = [MagicMock(pages=[mock_page])]
-    mock_playwright.return_value.__enter__.return_value.chromium.connect_over_cdp.return_value = mock_pw_browser
+    ac_mocks.page.goto_error = Exception("Timeout: page.goto exceeded 30s")
 
     result = web_browse(url="https://example.com")
     assert "Error" in result
     # Playwright browser should still be closed (try/finally)
-    mock_pw_browser.close.assert_called_once()
-
-
-@patch("yui.tools.agentcore.AGENTCORE_AVAILABLE", True)
-@patch("yui.tools.agentcore._get_memory_client")
-def test_memory_store_throttling_max_retries(mock_get_client) -> None:
-    """memory_store returns error after max retries on ThrottlingException."""
-    mock_client = MagicMock()
-    mock_client.create_or_get_memory.return_value = {"memoryId": "mem-123"}
+    assert ac_mocks.pw_browser.close_calls == 1
+    # The session is stopped rather than returned to the pool
+    ac_mocks.browser_client.stop.assert_called_once()
+    assert agentcore._browser_pool.idle_count() == 0
+    assert agentcore._browser_pool.active == 0
+
+
+@pytest.mark.parametrize(
+    ("client_method", "call", "max_retries"),
+    [
+        ("create_event", lambda n: memory_store(key="k", value="v", max_retries=n), 2),
+        ("retrieve_memories", lambda n: memory_recall(query="test", max_retries=n), 1),
+    ],
+    ids=["memory_store", "memory_recall"],
+)
+def test_memory_throttling_max_retries(ac_mocks, client_method, call, max_retries) -> None:
+    """Memory tools return an error after max retries on ThrottlingException."""
+    method = getattr(ac_mocks.memory_client, client_method)
     # Always raises throttling
-    mock_client.create_event.side_effect = Exception("ThrottlingException: Rate exceeded")
-    mock_get_client.return_value = mock_client
-
-    result = memory_store(key="k", value="v", max_retries=2)
-    assert "Error" in result
-    assert "attempts" in result
-    # Should have retried (max_retries+1 = 3 times)
-    assert mock_client.create_event.call_count == 3
-
-
-@patch("yui.tools.agentcore.AGENTCORE_AVAILABLE", True)
-@patch("yui.tools.agentcore._get_memory_client")
-def test_memory_recall_throttling_max_retries(mock_get_client) -> None:
-    """memory_recall returns error after max retries on ThrottlingException."""
-    mock_client = MagicMock()
-    mock_client.create_or_get_memory.return_value = {"memoryId": "mem-123"}
-    mock_client.retrieve_memories.side_effect = Exception("ThrottlingException: Rate exceeded")
-    mock_get_client.return_value = mock_client
+    method.side_effect = aws_error("ThrottlingException", client_method)
 
-    result = memory_recall(query="test", max_retries=1)
+    result = call(max_retries)
     assert "Error" in result
     assert "attempts" in result
-    # Should have retried (max_retries+1 = 2 times)
-    assert mock_client.retrieve_memories.call_count == 2
+    # Should have retried (max_retries+1 times)
+    assert method.call_count == max_retries + 1
 
 
-@patch("yui.tools.agentcore.AGENTCORE_AVAILABLE", True)
-@patch("yui.tools.agentcore._get_memory_client")
-def test_memory_store_access_denied_no_retry(mock_get_client) -> None:
+def test_memory_store_access_denied_no_retry(ac_mocks) -> None:
     """memory_store returns error immediately on AccessDeniedException (no retry)."""
-    mock_client = MagicMock()
-    mock_client.create_or_get_memory.return_value = {"memoryId": "mem-123"}
-    mock_client.create_event.side_effect = Exception("AccessDeniedException: Access denied")
-    mock_get_client.return_value = mock_client
+    mock_client = ac_mocks.memory_client
+    mock_client.create_event.side_effect = aws_error("AccessDeniedException", "CreateEvent")
 
     result = memory_store(key="k", value="v", max_retries=3)
     # Should NOT retry for AccessDeniedException
@@ -241,30 +497,20 @@ def test_memory_store_access_denied_no_retry(mock_get_client) -> None:
     assert mock_client.create_event.call_count == 1
 
 
-@patch("yui.tools.agentcore.AGENTCORE_AVAILABLE", True)
-@patch("yui.tools.agentcore.code_session")
-def test_code_execute_empty_output(mock_session) -> None:
+def test_code_execute_empty_output(ac_mocks) -> None:
     """code_execute returns '(no output)' when stdout and stderr are both empty."""
-    mock_interpreter = MagicMock()
-    mock_interpreter.execute_code.return_value = {"stdout": "", "stderr": ""}
-    mock_session.return_value.__enter__ = MagicMock(return_value=mock_interpreter)
-    mock_session.return_value.__exit__ = MagicMock(return_value=False)
+    ac_mocks.interpreter.execute_code.return_value = {"stdout": "", "stderr": ""}
 
     result = code_execute(code="x = 1 + 1")
     assert result == "(no output)"
 
 
-@patch("yui.tools.agentcore.AGENTCORE_AVAILABLE", True)
-@patch("yui.tools.agentcore.code_session")
-def test_code_execute_with_stderr(mock_session) -> None:
+def test_code_execute_with_stderr(ac_mocks) -> None:
     """code_execute includes stderr in output."""
-    mock_interpreter = MagicMock()
-    mock_interpreter.execute_code.return_value = {
+    ac_mocks.interpreter.execute_code.return_value = {
         "stdout": "42",
         "stderr": "DeprecationWarning: use new_func"
     }
-    mock_session.return_value.__enter__ = MagicMock(return_value=mock_interpreter)
-    mock_session.return_value.__exit__ = MagicMock(return_value=False)
 
     result = code_execute(code="print(42)")
     assert "42" in result
@@ -9,9 +9,22 @@ Requires:
   - Both bots in #yui-test channel (C0AH55CBKGW)
 
 Run: YUI_LIVE_INTEGRATION=1 python -m pytest tests/test_aya_yui_integration.py -v
+
+Set SLACK_APP_TOKEN_IT_LISTENER (an xapp- token for a dedicated listener app
+installed in #yui-test, subscribed to message.channels, and with no other
+Socket Mode client) to receive Yui's replies as events instead of polling
+conversation history. Under pytest-xdist the listener is off and every wait
+polls.
 """
 
+import bisect
+import functools
+import itertools
 import os
+import random
+import re
+import ssl
+import threading
 import time
 import json
 
@@ -29,25 +42,45 @@ pytestmark = [
 # Constants
 YUI_TEST_CHANNEL = "C0AH55CBKGW"  # #yui-test
 YUI_BOT_USER_ID = "U0AH51Y251U"
-POLL_INTERVAL = 3  # seconds between polls
+POLL_INTERVAL = 3  # max seconds between polls (backoff starts at POLL_BASE)
+POLL_BASE = 0.2
 MAX_WAIT = 90  # max seconds to wait for Yui response
+IT07_ACK_WAIT = 30  # IT-07 first turn (short acknowledgement)
+IT07_RECALL_WAIT = 60  # IT-07 follow-up that recalls the keyword
+
+
+def _any_word(*words: str) -> re.Pattern:
+    """Case-insensitive pattern matching any of ``words`` literally."""
+    return re.compile("|".join(map(re.escape, words)), re.IGNORECASE)
+
+
+# Response keywords checked by the tool-execution and delegation tests
+_WRITE_OK_RE = _any_word("書き", "wrote", "written", "完了", "done", "success", "ファイル")
+_BLOCKED_RE = _any_word(
+    "block", "拒否", "禁止", "できません", "cannot", "not allowed",
+    "denied", "security", "danger", "unsafe", "セキュリティ",
+)
+_KIRO_RESULT_RE = _any_word("kiro", "version", "バージョン", "__version__", "0.", "1.")
 
 
+_TOKEN_RE = re.compile(r"""^[ \t]*SLACK_BOT_TOKEN=["']?([^"'\r\n]*)""", re.M)
+
+
+@functools.lru_cache(maxsize=1)
 def _load_token() -> str:
     """Load Yui's Slack bot token for reading messages."""
     token = os.environ.get("SLACK_BOT_TOKEN", "")
-    if not token:
-        env_path = os.path.expanduser("~/.yui/.env")
-        if os.path.exists(env_path):
-            with open(env_path) as f:
-                for line in f:
-                    line = line.strip()
-                    if line.startswith("SLACK_BOT_TOKEN="):
-                        token = line.split("=", 1)[1].strip('"').strip("'")
-                        break
-    return token
+    if token:
+        return token
+    env_path = os.path.expanduser("~/.yui/.env")
+    if not os.path.exists(env_path):
+        return ""
+    with open(env_path) as f:
+        match = _TOKEN_RE.search(f.read())
+    return match.group(1).strip() if match else ""
 
 
+@functools.lru_cache(maxsize=1)
 def _load_aya_token() -> str:
     """Load AYA's Slack bot token for SENDING messages.
     
@@ -60,24 +93,55 @@ def _load_aya_token() -> str:
     # Read from OpenClaw config
     config_path = os.path.expanduser("~/.openclaw/openclaw.json")
     if os.path.exists(config_path):
-        import json
         with open(config_path) as f:
             config = json.load(f)
         token = config.get("channels", {}).get("slack", {}).get("botToken", "")
     return token
 
 
+_CLIENT_CACHE: dict = {}
+
+
+@functools.lru_cache(maxsize=1)
+def _ssl_context() -> ssl.SSLContext:
+    """One TLS context for every Slack call; CA certs load once, not per request."""
+    return ssl.create_default_context()
+
+
+def _client(token: str):
+    """Return one WebClient per token, reused across polls.
+
+    slack_sdk's sync client opens a connection per call (urllib), so the
+    shared pieces are the TLS context and retry handlers rather than a socket.
+    """
+    client = _CLIENT_CACHE.get(token)
+    if client is None:
+        from slack_sdk import WebClient
+        from slack_sdk.http_retry import (
+            ConnectionErrorRetryHandler,
+            RateLimitErrorRetryHandler,
+        )
+        client = _CLIENT_CACHE[token] = WebClient(
+            token=token,
+            ssl=_ssl_context(),
+            retry_handlers=[
+                ConnectionErrorRetryHandler(max_retry_count=3),
+                RateLimitErrorRetryHandler(max_retry_count=3),
+            ],
+        )
+    return client
+
+
 def slack_send(channel_id: str, text: str, thread_ts: str = None) -> dict:
     """Send a Slack message AS AYA to trigger Yui.
     
     Uses AYA's bot token so Yui sees it as a real mention (not self-message).
     """
-    from slack_sdk import WebClient
     token = _load_aya_token()
     if not token:
         pytest.skip("No AYA Slack token available (set SLACK_BOT_TOKEN_AYA)")
     
-    client = WebClient(token=token)
+    client = _client(token)
     kwargs = {"channel": channel_id, "text": text}
     if thread_ts:
         kwargs["thread_ts"] = thread_ts
@@ -90,71 +154,171 @@ def slack_read_after(channel_id: str, after_ts: str, thread_ts: str = None, limi
     
     Returns list of messages newer than after_ts.
     """
-    from slack_sdk import WebClient
+    if thread_ts:
+        return slack_poll(channel_id, thread_ts, after_ts, limit)[0]
+
     token = _load_token()
     if not token:
         pytest.skip("No Slack token available")
     
-    client = WebClient(token=token)
-    
-    if thread_ts:
-        result = client.conversations_replies(
-            channel=channel_id, ts=thread_ts, limit=limit
-        )
-    else:
-        result = client.conversations_history(
-            channel=channel_id, oldest=after_ts, limit=limit
-        )
-    
-    messages = result.get("messages", [])
-    # Filter to messages from Yui bot only, after our message
-    yui_msgs = [
-        m for m in messages
-        if m.get("user") == YUI_BOT_USER_ID and float(m["ts"]) > float(after_ts)
-    ]
-    return yui_msgs
+    client = _client(token)
+    result = client.conversations_history(
+        channel=channel_id, oldest=after_ts, limit=limit
+    )
+    return _yui_messages_after(result.get("messages", []), after_ts)
+
 
+def slack_poll(channel_id: str, thread_ts: str, after_ts: str = None, limit: int = 10) -> tuple[list, list]:
+    """Fetch Yui's thread replies and the parent's reactions in one API call.
 
-def slack_get_reactions(channel_id: str, ts: str) -> list:
-    """Get reactions on a specific message."""
-    from slack_sdk import WebClient
+    conversations.replies returns the parent message (with its ``reactions``)
+    followed by the replies, so a single request serves both wait helpers.
+
+    Returns:
+        (Yui messages newer than after_ts, reactions on the thread parent)
+    """
     token = _load_token()
     if not token:
         pytest.skip("No Slack token available")
-    
-    client = WebClient(token=token)
-    result = client.reactions_get(channel=channel_id, timestamp=ts)
-    message = result.get("message", {})
-    return message.get("reactions", [])
+
+    client = _client(token)
+    result = client.conversations_replies(channel=channel_id, ts=thread_ts, limit=limit)
+    messages = result.get("messages", [])
+    reactions = next((m.get("reactions", []) for m in messages if m.get("ts") == thread_ts), [])
+    return _yui_messages_after(messages, after_ts or thread_ts), reactions
+
+
+def _yui_messages_after(messages: list, after_ts: str) -> list:
+    """Filter to messages from Yui bot only, after our message."""
+    after = float(after_ts)
+    return [
+        m for m in messages
+        if m.get("user") == YUI_BOT_USER_ID and float(m["ts"]) > after
+    ]
+
+
+def backoff_sleep(attempt: int, base: float = POLL_BASE, cap: float = POLL_INTERVAL,
+                  deadline: float = None) -> None:
+    """Sleep before poll ``attempt + 1``: exponential from ``base`` up to ``cap``, plus jitter.
+
+    With a ``time.monotonic()`` ``deadline``, never sleeps past it, so the
+    last poll lands on the deadline instead of up to ``cap`` seconds after.
+    """
+    delay = min(base * (2 ** attempt), cap) + random.uniform(0, 0.1)
+    if deadline is not None:
+        delay = min(delay, max(deadline - time.monotonic(), 0.0))
+    time.sleep(delay)
+
+
+class YuiMessageListener:
+    """Collects Yui's messages from Slack Events over Socket Mode.
+
+    Connects with the app-level token of a dedicated listener app
+    (SLACK_APP_TOKEN_IT_LISTENER). Slack spreads an app's events across all of
+    its Socket Mode connections. So neither Yui's token nor AYA's can be used,
+    because the live bots already hold connections on those apps. This
+    listener must also be the listener app's only connection, which is why
+    yui_events leaves it off under pytest-xdist.
+    """
+
+    def __init__(self, app_token: str, bot_token: str):
+        from slack_sdk.socket_mode import SocketModeClient
+
+        # (ts, event) pairs kept sorted by ts so waits can bisect past after_ts
+        self._messages: list[tuple[float, dict]] = []
+        self._cond = threading.Condition()
+        self._client = SocketModeClient(app_token=app_token, web_client=_client(bot_token))
+        self._client.socket_mode_request_listeners.append(self._on_request)
+
+    def _on_request(self, client, req) -> None:
+        from slack_sdk.socket_mode.response import SocketModeResponse
+
+        client.send_socket_mode_response(SocketModeResponse(envelope_id=req.envelope_id))
+        event = req.payload.get("event", {}) if req.type == "events_api" else {}
+        if event.get("type") == "message" and event.get("user") == YUI_BOT_USER_ID:
+            with self._cond:
+                bisect.insort(self._messages, (float(event["ts"]), event), key=lambda entry: entry[0])
+                self._cond.notify_all()
+
+    def connect(self) -> "YuiMessageListener":
+        self._client.connect()
+        return self
+
+    def close(self) -> None:
+        self._client.close()
+
+    def wait(self, channel_id: str, after_ts: str, thread_ts: str = None, timeout: float = MAX_WAIT) -> list:
+        """Block until Yui posts in the channel (or thread) after ``after_ts``."""
+        after = float(after_ts)
+
+        def matching() -> list:
+            start = bisect.bisect_right(self._messages, after, key=lambda entry: entry[0])
+            return [
+                m for _, m in self._messages[start:]
+                if m.get("channel") == channel_id
+                and (thread_ts is None or m.get("thread_ts") == thread_ts)
+            ]
+
+        with self._cond:
+            self._cond.wait_for(matching, timeout=timeout)
+            return matching()
+
+
+# Set by the yui_events fixture when a listener app token is configured
+_listener: YuiMessageListener = None
+
+
+@pytest.fixture(scope="module", autouse=True)
+def yui_events():
+    """Listen for Yui's messages over Socket Mode for the whole module, if possible.
+
+    Off under pytest-xdist: one listener per worker would split the listener
+    app's events between workers, and each would miss most of Yui's replies.
+    """
+    global _listener
+    app_token = os.environ.get("SLACK_APP_TOKEN_IT_LISTENER", "")
+    bot_token = _load_aya_token()
+    if not (app_token and bot_token) or os.environ.get("PYTEST_XDIST_WORKER"):
+        yield None
+        return
+    _listener = YuiMessageListener(app_token, bot_token).connect()
+    try:
+        yield _listener
+    finally:
+        _listener.close()
+        _listener = None
 
 
 def wait_for_yui_response(channel_id: str, after_ts: str, thread_ts: str = None, 
                            max_wait: int = MAX_WAIT) -> list:
-    """Poll until Yui responds or timeout."""
-    elapsed = 0
-    while elapsed < max_wait:
+    """Wait until Yui responds or timeout.
+
+    Event-driven when the Socket Mode listener is running; otherwise polls
+    with backoff_sleep between reads.
+    """
+    if _listener is not None:
+        return _listener.wait(channel_id, after_ts, thread_ts, timeout=max_wait)
+
+    deadline = time.monotonic() + max_wait
+    for attempt in itertools.count():
         msgs = slack_read_after(channel_id, after_ts, thread_ts)
-        if msgs:
+        if msgs or time.monotonic() >= deadline:
             return msgs
-        time.sleep(POLL_INTERVAL)
-        elapsed += POLL_INTERVAL
-    return []
+        backoff_sleep(attempt, deadline=deadline)
 
 
 def wait_for_yui_reaction(channel_id: str, ts: str, max_wait: int = 30) -> list:
     """Poll until Yui adds a reaction or timeout."""
-    elapsed = 0
-    while elapsed < max_wait:
-        reactions = slack_get_reactions(channel_id, ts)
+    deadline = time.monotonic() + max_wait
+    for attempt in itertools.count():
+        _, reactions = slack_poll(channel_id, ts)
         yui_reactions = [
             r for r in reactions 
             if YUI_BOT_USER_ID in r.get("users", [])
         ]
-        if yui_reactions:
+        if yui_reactions or time.monotonic() >= deadline:
             return yui_reactions
-        time.sleep(POLL_INTERVAL)
-        elapsed += POLL_INTERVAL
-    return []
+        backoff_sleep(attempt, deadline=deadline)
 
 
 # ============================================================
@@ -286,8 +450,8 @@ class TestIT05FileOperation:
         assert len(responses) > 0, "Yui did not respond"
         
         # Yui should confirm file was written
-        response_text = responses[0].get("text", "").lower()
-        assert any(word in response_text for word in ["書き", "wrote", "written", "完了", "done", "success", "ファイル"]), \
+        response_text = responses[0].get("text", "")
+        assert _WRITE_OK_RE.search(response_text), \
             f"Response doesn't indicate file write success: {response_text[:200]}"
 
 
@@ -308,12 +472,10 @@ class TestIT06BlockedCommand:
         responses = wait_for_yui_response(YUI_TEST_CHANNEL, sent_ts, thread_ts=sent_ts)
         assert len(responses) > 0, "Yui did not respond"
         
-        response_text = responses[0].get("text", "").lower()
+        response_text = responses[0].get("text", "")
         # Should mention blocking/refusal
-        assert any(word in response_text for word in [
-            "block", "拒否", "禁止", "できません", "cannot", "not allowed", 
-            "denied", "security", "danger", "unsafe", "セキュリティ"
-        ]), f"Response doesn't indicate command was blocked: {response_text[:200]}"
+        assert _BLOCKED_RE.search(response_text), \
+            f"Response doesn't indicate command was blocked: {response_text[:200]}"
 
 
 # ============================================================
@@ -335,7 +497,12 @@ class TestIT07SessionMemory:
         assert result1["ok"]
         thread_ts = result1["ts"]
         
-        responses1 = wait_for_yui_response(YUI_TEST_CHANNEL, thread_ts, thread_ts=thread_ts)
+        # The first turn must finish before the follow-up, or the session
+        # history Yui recalls from may not contain it yet. It is a short
+        # acknowledgement, so it gets a tighter budget than the recall turn.
+        responses1 = wait_for_yui_response(
+            YUI_TEST_CHANNEL, thread_ts, thread_ts=thread_ts, max_wait=IT07_ACK_WAIT
+        )
         assert len(responses1) > 0, "Yui did not respond to first message"
         
         # Follow up — ask Yui to recall
@@ -349,7 +516,7 @@ class TestIT07SessionMemory:
         sent_ts2 = result2["ts"]
         
         responses2 = wait_for_yui_response(
-            YUI_TEST_CHANNEL, sent_ts2, thread_ts=thread_ts
+            YUI_TEST_CHANNEL, sent_ts2, thread_ts=thread_ts, max_wait=IT07_RECALL_WAIT
         )
         assert len(responses2) > 0, "Yui did not respond to follow-up"
         
@@ -405,6 +572,5 @@ class TestIT09KiroDelegation:
         
         response_text = responses[0].get("text", "")
         # Should mention version or Kiro
-        assert any(word in response_text.lower() for word in [
-            "kiro", "version", "バージョン", "__version__", "0.", "1."
-        ]), f"Response doesn't show Kiro results: {response_text[:200]}"
+        assert _KIRO_RESULT_RE.search(response_text), \
+            f"Response doesn't show Kiro results: {response_text[:200]}"
@@ -8,6 +8,7 @@ from pathlib import Path
 
 import pytest
 
+from yui.autonomy import budget
 from yui.autonomy.budget import (
     BEDROCK_PRICING,
     CostBudgetGuard,
@@ -27,7 +28,7 @@ SONNET_MODEL = "us.anthropic.claude-sonnet-4-20250514-v1:0"
 
 @pytest.fixture()
 def usage_file(tmp_path: Path) -> Path:
-    return tmp_path / "usage.json"
+    return tmp_path / "usage.jsonl"
 
 
 @pytest.fixture()
@@ -61,8 +62,33 @@ class TestRecordUsage:
     def test_record_persists_to_file(self, guard: CostBudgetGuard, usage_file: Path):
         guard.record_usage(SONNET_MODEL, 1000, 500)
         assert usage_file.exists()
-        data = json.loads(usage_file.read_text())
-        assert len(data["records"]) == 1
+        lines = usage_file.read_text().splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])["input_tokens"] == 1000
+
+    def test_record_appends_one_line_per_call(self, guard: CostBudgetGuard, usage_file: Path):
+        guard.record_usage(SONNET_MODEL, 1000, 500)
+        first = usage_file.read_bytes()
+        guard.record_usage(SONNET_MODEL, 2000, 1000)
+        content = usage_file.read_bytes()
+        assert content.startswith(first)
+        assert len(content.splitlines()) == 2
+
+    def test_record_usage_many(self, guard: CostBudgetGuard, usage_file: Path):
+        guard.record_usage(SONNET_MODEL, 1, 1)
+        records = guard.record_usage_many([(SONNET_MODEL, 10, 5), (SONNET_MODEL, 20, 0)])
+        assert [r.input_tokens for r in records] == [10, 20]
+        lines = usage_file.read_text().splitlines()
+        assert [json.loads(line)["input_tokens"] for line in lines] == [1, 10, 20]
+
+    def test_batch_defers_writes_until_exit(self, guard: CostBudgetGuard, usage_file: Path):
+        with guard.batch():
+            guard.record_usage(SONNET_MODEL, 1, 1)
+            with guard.batch():
+                guard.record_usage(SONNET_MODEL, 2, 2)
+            assert not usage_file.exists()
+            assert len(guard.records) == 2
+        assert len(usage_file.read_text().splitlines()) == 2
 
     def test_record_unknown_model_uses_fallback(self, guard: CostBudgetGuard):
         rec = guard.record_usage("unknown-model-id", 1000, 500)
@@ -103,6 +129,30 @@ class TestGetMonthlyCost:
         expected = (1000 / 1000) * 0.003 + (500 / 1000) * 0.015
         assert abs(guard.get_monthly_cost() - expected) < 0.001
 
+    def test_running_total_matches_records(self, guard: CostBudgetGuard, usage_file: Path):
+        for _ in range(50):
+            guard.record_usage(SONNET_MODEL, 1000, 500)
+        expected = sum(r.estimated_cost_usd for r in guard.records)
+        assert guard.get_monthly_cost() == pytest.approx(expected)
+        assert CostBudgetGuard(usage_file=str(usage_file)).get_monthly_cost() == pytest.approx(expected)
+
+    def test_records_appended_directly_are_counted(self, usage_file: Path):
+        guard = CostBudgetGuard(max_monthly_usd=50.0, usage_file=str(usage_file))
+        assert guard.get_monthly_cost() == 0.0
+        guard.records.append(
+            UsageRecord(
+                timestamp=datetime.now(timezone.utc).isoformat(),
+                model_id=SONNET_MODEL,
+                input_tokens=0,
+                output_tokens=0,
+                estimated_cost_usd=60.0,
+            )
+        )
+        assert guard.get_monthly_cost() == pytest.approx(60.0)
+        guard.record_usage(SONNET_MODEL, 1000, 0)
+        assert guard.get_monthly_cost() == pytest.approx(60.003)
+        assert guard.check_budget()[0] is False
+
 
 # --------------------------------------------------------------------------
 # check_budget — AC-77
@@ -159,8 +209,10 @@ class TestReset:
     def test_reset_persists(self, guard: CostBudgetGuard, usage_file: Path):
         guard.record_usage(SONNET_MODEL, 1000, 500)
         guard.reset()
-        data = json.loads(usage_file.read_text())
-        assert len(data["records"]) == 0
+        assert usage_file.read_text() == ""
+        # Appends after a reset start a fresh log
+        guard.record_usage(SONNET_MODEL, 1000, 500)
+        assert len(usage_file.read_text().splitlines()) == 1
 
 
 # --------------------------------------------------------------------------
@@ -169,6 +221,16 @@ class TestReset:
 
 
 class TestPersistence:
+    @pytest.fixture(autouse=True, params=["orjson", "json"])
+    def json_backend(self, request, monkeypatch):
+        """Run every persistence test against both serializer backends."""
+        if request.param == "orjson":
+            if budget.orjson is None:
+                pytest.skip("orjson not installed")
+        else:
+            monkeypatch.setattr(budget, "orjson", None)
+        return request.param
+
     def test_load_from_existing_file(self, usage_file: Path):
         now = datetime.now(timezone.utc).isoformat()
         data = {
@@ -187,6 +249,35 @@ class TestPersistence:
         assert len(guard.records) == 1
         assert guard.records[0].input_tokens == 5000
 
+    def test_load_legacy_json_migrates_to_jsonl(self, usage_file: Path):
+        now = datetime.now(timezone.utc).isoformat()
+        records = [
+            {"timestamp": now, "model_id": SONNET_MODEL, "input_tokens": i,
+             "output_tokens": 0, "estimated_cost_usd": 0.0}
+            for i in (1, 2)
+        ]
+        usage_file.write_text(json.dumps({"records": records}, indent=2))
+        guard = CostBudgetGuard(usage_file=str(usage_file))
+        assert [r.input_tokens for r in guard.records] == [1, 2]
+        assert [json.loads(line) for line in usage_file.read_text().splitlines()] == records
+
+    def test_load_legacy_sibling_json_file(self, usage_file: Path):
+        now = datetime.now(timezone.utc).isoformat()
+        record = {"timestamp": now, "model_id": SONNET_MODEL, "input_tokens": 3,
+                  "output_tokens": 0, "estimated_cost_usd": 0.0}
+        usage_file.with_suffix(".json").write_text(json.dumps({"records": [record]}))
+        guard = CostBudgetGuard(usage_file=str(usage_file))
+        assert [r.input_tokens for r in guard.records] == [3]
+        assert json.loads(usage_file.read_text()) == record
+
+    def test_load_jsonl_skips_bad_lines(self, usage_file: Path):
+        now = datetime.now(timezone.utc).isoformat()
+        good = json.dumps({"timestamp": now, "model_id": SONNET_MODEL, "input_tokens": 7,
+                           "output_tokens": 0, "estimated_cost_usd": 0.0})
+        usage_file.write_text(f"{good}\n{{truncated\n\n{good}\n")
+        guard = CostBudgetGuard(usage_file=str(usage_file))
+        assert [r.input_tokens for r in guard.records] == [7, 7]
+
     def test_load_corrupted_file(self, usage_file: Path):
         usage_file.write_text("not json")
         guard = CostBudgetGuard(usage_file=str(usage_file))
@@ -206,6 +297,10 @@ class TestPricing:
     def test_sonnet_pricing_exists(self):
         assert SONNET_MODEL in BEDROCK_PRICING
 
+    def test_pricing_table_is_read_only(self):
+        with pytest.raises(TypeError):
+            BEDROCK_PRICING[SONNET_MODEL]["input_per_1k"] = 0.0  # type: ignore[index]
+
     def test_cost_calculation(self, guard: CostBudgetGuard):
         rec = guard.record_usage(SONNET_MODEL, 1000, 1000)
         expected = (1000 / 1000) * 0.003 + (1000 / 1000) * 0.015
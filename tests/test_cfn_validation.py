@@ -11,19 +11,24 @@ Tests for yui-agent-base.yaml:
 """
 
 import os
+from collections import defaultdict
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import NamedTuple
 from unittest.mock import MagicMock, patch
 
-import boto3
 import pytest
 import yaml
 from pathlib import Path
 
+from tests.helpers import YamlSafeLoader
+
 pytestmark = pytest.mark.integration
 
 
 
-# CFn専用YAMLローダー（CFnタグを処理）
-class CFnYAMLLoader(yaml.SafeLoader):
+# CFn専用YAMLローダー（CFnタグを処理）— libyaml があれば C 実装を使う
+class CFnYAMLLoader(YamlSafeLoader):
     pass
 
 def cfn_constructor(loader, tag_suffix, node):
@@ -45,19 +50,87 @@ for tag in cfn_tags:
 # テンプレートファイルパス
 CFN_TEMPLATE_PATH = Path(__file__).parent.parent / "cfn" / "yui-agent-base.yaml"
 
-
-@pytest.fixture
-def cfn_template():
-    """CFnテンプレートのロード（CFn固有タグを処理）"""
-    with open(CFN_TEMPLATE_PATH, "r", encoding="utf-8") as f:
-        return yaml.load(f, CFnYAMLLoader)
-
-
-@pytest.fixture
-def cfn_template_str():
+# 期待値（モジュール読み込み時に1回だけ構築）
+ENVIRONMENT_ALLOWED_VALUES = frozenset({"dev", "staging", "prod"})
+CONTENT_FILTER_ALLOWED_VALUES = frozenset({"NONE", "LOW", "MEDIUM", "HIGH"})
+REQUIRED_RESOURCE_TYPES = frozenset({
+    "AWS::IAM::ManagedPolicy",
+    "AWS::IAM::User",
+    "AWS::IAM::AccessKey",
+    "AWS::Bedrock::Guardrail",
+    "AWS::SecretsManager::Secret",
+})
+REQUIRED_BEDROCK_ACTIONS = frozenset({
+    "bedrock:InvokeModel",
+    "bedrock:InvokeModelWithResponseStream",
+    "bedrock:ApplyGuardrail",
+    "bedrock:GetGuardrail",
+})
+REQUIRED_AGENTCORE_ACTIONS = frozenset({
+    "bedrock-agentcore:CreateBrowserSession",
+    "bedrock-agentcore:CreateMemory",
+    "bedrock-agentcore:CreateCodeInterpreterSession",
+})
+REQUIRED_FILTER_TYPES = frozenset({
+    "SEXUAL", "HATE", "VIOLENCE", "INSULTS", "MISCONDUCT", "PROMPT_ATTACK",
+})
+
+
+@pytest.fixture(scope="session")
+def cfn_template_bytes():
+    """CFnテンプレートの生バイト列（セッションで1回だけ読み込む）"""
+    return CFN_TEMPLATE_PATH.read_bytes()
+
+
+@pytest.fixture(scope="session")
+def cfn_template_str(cfn_template_bytes):
     """CFnテンプレートの文字列版"""
-    with open(CFN_TEMPLATE_PATH, "r", encoding="utf-8") as f:
-        return f.read()
+    return cfn_template_bytes.decode("utf-8")
+
+
+@pytest.fixture(scope="session")
+def cfn_template(cfn_template_bytes):
+    """CFnテンプレートのロード（CFn固有タグを処理）
+
+    libyaml はバイト列をそのまま受け取れるため、デコードを挟まずにパースする。
+    セッション共有のため読み取り専用。変更が必要なテストは copy.deepcopy すること。
+    """
+    return MappingProxyType(yaml.load(cfn_template_bytes, CFnYAMLLoader))
+
+
+def _listify(value):
+    """IAM の Action は文字列単体でもリストでもよい"""
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+class CFnIndex(NamedTuple):
+    """テンプレートから導出した検証用の集合（セッションで1回だけ構築）"""
+
+    resource_types: frozenset[str]
+    actions_by_service: Mapping[str, frozenset[str]]  # "bedrock" → {"bedrock:InvokeModel", ...}
+    filter_types: frozenset[str]
+
+
+@pytest.fixture(scope="session")
+def cfn_index(cfn_template):
+    """リソースタイプ・IAMアクション・フィルタータイプの索引"""
+    resources = cfn_template["Resources"]
+    statements = resources["YuiPolicy"]["Properties"]["PolicyDocument"]["Statement"]
+    # サービス接頭辞ごとに1パスで振り分ける
+    actions_by_service = defaultdict(set)
+    for statement in statements:
+        for action in _listify(statement.get("Action")):
+            actions_by_service[action.split(":", 1)[0]].add(action)
+    filters = resources["YuiGuardrail"]["Properties"]["ContentPolicyConfig"]["FiltersConfig"]
+    return CFnIndex(
+        resource_types=frozenset(res["Type"] for res in resources.values()),
+        actions_by_service=MappingProxyType(
+            {service: frozenset(names) for service, names in actions_by_service.items()}
+        ),
+        filter_types=frozenset(f["Type"] for f in filters),
+    )
 
 
 class TestCFnTemplateStructure:
@@ -66,20 +139,20 @@ class TestCFnTemplateStructure:
     def test_yaml_parseable(self, cfn_template):
         """YAMLが正常にパース可能であることを確認"""
         assert cfn_template is not None
-        assert isinstance(cfn_template, dict)
+        assert isinstance(cfn_template, Mapping)
 
     def test_required_fields_present(self, cfn_template):
         """必須フィールドの存在確認"""
-        required_fields = [
+        required_fields = {
             "AWSTemplateFormatVersion",
             "Description",
-            "Parameters", 
+            "Parameters",
             "Resources",
             "Outputs"
-        ]
-        
-        for field in required_fields:
-            assert field in cfn_template, f"Required field '{field}' is missing"
+        }
+
+        missing = required_fields - cfn_template.keys()
+        assert not missing, f"Required fields missing: {sorted(missing)}"
 
     def test_aws_template_format_version(self, cfn_template):
         """AWSTemplateFormatVersionが正しいことを確認"""
@@ -94,10 +167,10 @@ class TestParameters:
         parameters = cfn_template["Parameters"]
         
         # 期待するパラメータ
-        expected_params = ["Environment", "BedrockRegion", "GuardrailName", "ContentFilterStrength"]
-        
-        for param in expected_params:
-            assert param in parameters, f"Parameter '{param}' is missing"
+        expected_params = {"Environment", "BedrockRegion", "GuardrailName", "ContentFilterStrength"}
+
+        missing = expected_params - parameters.keys()
+        assert not missing, f"Parameters missing: {sorted(missing)}"
 
     def test_environment_parameter_validation(self, cfn_template):
         """Environmentパラメータの検証"""
@@ -105,7 +178,7 @@ class TestParameters:
         
         assert env_param["Type"] == "String"
         assert env_param["Default"] == "dev"
-        assert set(env_param["AllowedValues"]) == {"dev", "staging", "prod"}
+        assert frozenset(env_param["AllowedValues"]) == ENVIRONMENT_ALLOWED_VALUES
 
     def test_content_filter_strength_parameter(self, cfn_template):
         """ContentFilterStrengthパラメータの検証"""
@@ -113,7 +186,7 @@ class TestParameters:
         
         assert filter_param["Type"] == "String"
         assert filter_param["Default"] == "HIGH"
-        assert set(filter_param["AllowedValues"]) == {"NONE", "LOW", "MEDIUM", "HIGH"}
+        assert frozenset(filter_param["AllowedValues"]) == CONTENT_FILTER_ALLOWED_VALUES
 
 
 class TestResourceDefinitions:
@@ -123,35 +196,27 @@ class TestResourceDefinitions:
         """IAM関連リソースの存在確認"""
         resources = cfn_template["Resources"]
         
-        iam_resources = ["YuiPolicy", "YuiUser", "YuiAccessKey"]
-        for resource in iam_resources:
-            assert resource in resources, f"IAM resource '{resource}' is missing"
-
-    def test_iam_resource_types(self, cfn_template):
-        """IAMリソースタイプの検証"""
-        resources = cfn_template["Resources"]
-        
-        assert resources["YuiPolicy"]["Type"] == "AWS::IAM::ManagedPolicy"
-        assert resources["YuiUser"]["Type"] == "AWS::IAM::User"  
-        assert resources["YuiAccessKey"]["Type"] == "AWS::IAM::AccessKey"
-
-    def test_bedrock_guardrail_present(self, cfn_template):
-        """Bedrock Guardrailリソースの存在確認"""
+        iam_resources = {"YuiPolicy", "YuiUser", "YuiAccessKey"}
+
+        missing = iam_resources - resources.keys()
+        assert not missing, f"IAM resources missing: {sorted(missing)}"
+
+    @pytest.mark.parametrize(
+        ("name", "expected_type"),
+        [
+            ("YuiPolicy", "AWS::IAM::ManagedPolicy"),
+            ("YuiUser", "AWS::IAM::User"),
+            ("YuiAccessKey", "AWS::IAM::AccessKey"),
+            ("YuiGuardrail", "AWS::Bedrock::Guardrail"),
+            ("YuiSlackSecrets", "AWS::SecretsManager::Secret"),
+        ],
+    )
+    def test_resource_type(self, cfn_template, name, expected_type):
+        """IAM・Bedrock Guardrail・Secrets Manager リソースの存在とタイプを確認"""
         resources = cfn_template["Resources"]
-        
-        assert "YuiGuardrail" in resources, "Bedrock Guardrail resource is missing"
-        
-        guardrail = resources["YuiGuardrail"]
-        assert guardrail["Type"] == "AWS::Bedrock::Guardrail"
 
-    def test_secrets_manager_present(self, cfn_template):
-        """Secrets Managerリソースの存在確認"""
-        resources = cfn_template["Resources"]
-        
-        assert "YuiSlackSecrets" in resources, "Secrets Manager resource is missing"
-        
-        secret = resources["YuiSlackSecrets"]
-        assert secret["Type"] == "AWS::SecretsManager::Secret"
+        assert name in resources, f"Resource '{name}' is missing"
+        assert resources[name]["Type"] == expected_type
 
 
 class TestOutputs:
@@ -161,18 +226,18 @@ class TestOutputs:
         """必要な出力値が定義されていることを確認"""
         outputs = cfn_template["Outputs"]
         
-        expected_outputs = [
+        expected_outputs = {
             "YuiUserArn",
-            "YuiAccessKeyId", 
+            "YuiAccessKeyId",
             "YuiSecretAccessKey",
             "GuardrailId",
             "GuardrailVersion",
             "SlackSecretsArn",
             "PolicyArn"
-        ]
-        
-        for output in expected_outputs:
-            assert output in outputs, f"Output '{output}' is missing"
+        }
+
+        missing = expected_outputs - outputs.keys()
+        assert not missing, f"Outputs missing: {sorted(missing)}"
 
     def test_outputs_have_descriptions(self, cfn_template):
         """全ての出力値に説明があることを確認"""
@@ -186,80 +251,41 @@ class TestOutputs:
 class TestTemplateValidation:
     """CFnテンプレート全体のバリデーション"""
 
-    def test_template_has_all_required_resource_types(self, cfn_template):
+    def test_template_has_all_required_resource_types(self, cfn_index):
         """必要なリソースタイプが全て含まれていることを確認"""
-        resources = cfn_template["Resources"]
-        resource_types = {res["Type"] for res in resources.values()}
-        
-        expected_types = {
-            "AWS::IAM::ManagedPolicy",
-            "AWS::IAM::User",
-            "AWS::IAM::AccessKey", 
-            "AWS::Bedrock::Guardrail",
-            "AWS::SecretsManager::Secret"
-        }
-        
-        assert expected_types.issubset(resource_types), f"Missing resource types: {expected_types - resource_types}"
+        resource_types = cfn_index.resource_types
 
-    def test_bedrock_permissions_in_policy(self, cfn_template):
+        assert resource_types >= REQUIRED_RESOURCE_TYPES, (
+            f"Missing resource types: {REQUIRED_RESOURCE_TYPES - resource_types}"
+        )
+
+    def test_bedrock_permissions_in_policy(self, cfn_index):
         """IAMポリシーにBedrock権限が含まれていることを確認"""
-        policy = cfn_template["Resources"]["YuiPolicy"]
-        policy_doc = policy["Properties"]["PolicyDocument"]
-        statements = policy_doc["Statement"]
-        
-        # Bedrock関連のアクションを探す
-        bedrock_actions = []
-        for statement in statements:
-            if isinstance(statement.get("Action"), list):
-                bedrock_actions.extend([action for action in statement["Action"] if action.startswith("bedrock")])
-        
-        assert len(bedrock_actions) > 0, "No Bedrock permissions found in IAM policy"
-        
+        actual_actions = cfn_index.actions_by_service.get("bedrock", frozenset())
+        assert actual_actions, "No Bedrock permissions found in IAM policy"
+
         # 必須のBedrock権限を確認
-        required_actions = {
-            "bedrock:InvokeModel",
-            "bedrock:InvokeModelWithResponseStream",
-            "bedrock:ApplyGuardrail",
-            "bedrock:GetGuardrail"
-        }
-        actual_actions = set(bedrock_actions)
-        assert required_actions.issubset(actual_actions), f"Missing Bedrock actions: {required_actions - actual_actions}"
+        assert actual_actions >= REQUIRED_BEDROCK_ACTIONS, (
+            f"Missing Bedrock actions: {REQUIRED_BEDROCK_ACTIONS - actual_actions}"
+        )
 
-    def test_agentcore_permissions_in_policy(self, cfn_template):
+    def test_agentcore_permissions_in_policy(self, cfn_index):
         """IAMポリシーにAgentCore権限が含まれていることを確認"""
-        policy = cfn_template["Resources"]["YuiPolicy"]
-        policy_doc = policy["Properties"]["PolicyDocument"]
-        statements = policy_doc["Statement"]
-        
-        # AgentCore関連のアクションを探す
-        agentcore_actions = []
-        for statement in statements:
-            if isinstance(statement.get("Action"), list):
-                agentcore_actions.extend([action for action in statement["Action"] if action.startswith("bedrock-agentcore")])
-        
-        assert len(agentcore_actions) > 0, "No AgentCore permissions found in IAM policy"
-        
+        agentcore_actions = cfn_index.actions_by_service.get("bedrock-agentcore", frozenset())
+        assert agentcore_actions, "No AgentCore permissions found in IAM policy"
+
         # 必須のAgentCore権限カテゴリを確認
-        required_prefixes = [
-            "bedrock-agentcore:CreateBrowserSession",
-            "bedrock-agentcore:CreateMemory",
-            "bedrock-agentcore:CreateCodeInterpreterSession"
-        ]
-        
-        for prefix in required_prefixes:
-            assert any(action.startswith(prefix) for action in agentcore_actions), f"Missing AgentCore permission: {prefix}"
+        assert agentcore_actions >= REQUIRED_AGENTCORE_ACTIONS, (
+            f"Missing AgentCore permissions: {REQUIRED_AGENTCORE_ACTIONS - agentcore_actions}"
+        )
 
-    def test_guardrail_content_filters(self, cfn_template):
+    def test_guardrail_content_filters(self, cfn_index):
         """Guardrailにコンテンツフィルターが設定されていることを確認"""
-        guardrail = cfn_template["Resources"]["YuiGuardrail"] 
-        content_policy = guardrail["Properties"]["ContentPolicyConfig"]
-        filters = content_policy["FiltersConfig"]
-        
-        # 期待するフィルタータイプ
-        expected_filter_types = {"SEXUAL", "HATE", "VIOLENCE", "INSULTS", "MISCONDUCT", "PROMPT_ATTACK"}
-        actual_filter_types = {f["Type"] for f in filters}
-        
-        assert expected_filter_types.issubset(actual_filter_types), f"Missing filter types: {expected_filter_types - actual_filter_types}"
+        actual_filter_types = cfn_index.filter_types
+
+        assert actual_filter_types >= REQUIRED_FILTER_TYPES, (
+            f"Missing filter types: {REQUIRED_FILTER_TYPES - actual_filter_types}"
+        )
 
 
 # 実AWS環境でのテスト（skip条件付き）
@@ -273,6 +299,8 @@ class TestAWSIntegration:
     )
     def test_validate_template_real_aws(self, cfn_template_str):
         """実AWS環境でのvalidate-template実行"""
+        import boto3
+
         client = boto3.client("cloudformation", region_name="us-east-1")
         
         try:
@@ -294,6 +322,8 @@ class TestAWSIntegration:
     )
     def test_create_changeset_dry_run(self, cfn_template_str):
         """dry-run changesetテスト"""
+        import boto3
+
         client = boto3.client("cloudformation", region_name="us-east-1")
         
         stack_name = "yui-agent-test-stack-dry-run"
@@ -351,9 +381,9 @@ class TestAWSIntegrationMocked:
             "Description": "Yui Agent Infrastructure",
         }
 
-        with patch("boto3.client", return_value=mock_client):
+        with patch("boto3.client", return_value=mock_client) as boto3_client:
             # Act
-            client = boto3.client("cloudformation", region_name="us-east-1")
+            client = boto3_client("cloudformation", region_name="us-east-1")
             response = client.validate_template(TemplateBody=cfn_template_str)
 
             # Assert
@@ -374,9 +404,9 @@ class TestAWSIntegrationMocked:
             "ValidateTemplate",
         )
 
-        with patch("boto3.client", return_value=mock_client):
+        with patch("boto3.client", return_value=mock_client) as boto3_client:
             # Act & Assert
-            client = boto3.client("cloudformation", region_name="us-east-1")
+            client = boto3_client("cloudformation", region_name="us-east-1")
             with pytest.raises(ClientError) as exc_info:
                 client.validate_template(TemplateBody="invalid: [")
 
@@ -393,9 +423,9 @@ class TestAWSIntegrationMocked:
         }
         mock_client.delete_change_set.return_value = {}
 
-        with patch("boto3.client", return_value=mock_client):
+        with patch("boto3.client", return_value=mock_client) as boto3_client:
             # Act
-            client = boto3.client("cloudformation", region_name="us-east-1")
+            client = boto3_client("cloudformation", region_name="us-east-1")
             response = client.create_change_set(
                 StackName="yui-agent-test-stack-dry-run",
                 TemplateBody=cfn_template_str,
@@ -434,8 +464,8 @@ class TestCFnValidationNegative:
             "ValidateTemplate"
         )
 
-        with patch("boto3.client", return_value=mock_client):
-            client = boto3.client("cloudformation", region_name="us-east-1")
+        with patch("boto3.client", return_value=mock_client) as boto3_client:
+            client = boto3_client("cloudformation", region_name="us-east-1")
             with pytest.raises(ClientError) as exc_info:
                 client.validate_template(TemplateBody="{}")
             assert "ValidationError" in str(exc_info.value)
@@ -451,8 +481,8 @@ class TestCFnValidationNegative:
             "ValidateTemplate"
         )
 
-        with patch("boto3.client", return_value=mock_client):
-            client = boto3.client("cloudformation", region_name="us-east-1")
+        with patch("boto3.client", return_value=mock_client) as boto3_client:
+            client = boto3_client("cloudformation", region_name="us-east-1")
             with pytest.raises(ClientError) as exc_info:
                 client.validate_template(TemplateBody=": invalid: yaml: {{{{")
             assert "ValidationError" in str(exc_info.value)
@@ -468,8 +498,8 @@ class TestCFnValidationNegative:
             "ValidateTemplate"
         )
 
-        with patch("boto3.client", return_value=mock_client):
-            client = boto3.client("cloudformation", region_name="us-east-1")
+        with patch("boto3.client", return_value=mock_client) as boto3_client:
+            client = boto3_client("cloudformation", region_name="us-east-1")
             with pytest.raises(ClientError) as exc_info:
                 client.validate_template(TemplateBody="...")
             assert "AccessDeniedException" in str(exc_info.value)
@@ -484,8 +514,8 @@ class TestCFnValidationNegative:
             "CreateChangeSet"
         )
 
-        with patch("boto3.client", return_value=mock_client):
-            client = boto3.client("cloudformation", region_name="us-east-1")
+        with patch("boto3.client", return_value=mock_client) as boto3_client:
+            client = boto3_client("cloudformation", region_name="us-east-1")
             with pytest.raises(ClientError) as exc_info:
                 client.create_change_set(
                     StackName="existing-stack",
@@ -505,8 +535,8 @@ class TestCFnValidationNegative:
             "ValidateTemplate"
         )
 
-        with patch("boto3.client", return_value=mock_client):
-            client = boto3.client("cloudformation", region_name="us-east-1")
+        with patch("boto3.client", return_value=mock_client) as boto3_client:
+            client = boto3_client("cloudformation", region_name="us-east-1")
             with pytest.raises(ClientError) as exc_info:
                 client.validate_template(TemplateBody="")
             assert "ValidationError" in str(exc_info.value)
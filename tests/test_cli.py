@@ -1,45 +1,55 @@
 """Tests for yui.cli — AC-01, AC-08."""
 
 import io
-import sys
-from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock
 
 import pytest
 
+from yui.config import DEFAULT_CONFIG
+
 pytestmark = pytest.mark.component
 
 
 
+@pytest.fixture
+def repl_deps(monkeypatch):
+    """Stub config loading and agent creation on yui.cli itself.
+
+    Patching only yui.config.load_config does not reach yui.cli once another
+    test has imported it while that name was patched, so both are set here.
+    """
+    monkeypatch.setattr("yui.cli.load_config", lambda *args, **kwargs: DEFAULT_CONFIG)
+    agent = MagicMock()
+    monkeypatch.setattr("yui.agent.create_agent", lambda config: agent)
+    return agent
+
+
+@pytest.mark.usefixtures("repl_deps")
 class TestCLIStartup:
     """AC-01: python -m yui starts a CLI REPL that accepts user input."""
 
-    def test_repl_starts_and_exits_on_eof(self):
+    def test_repl_starts_and_exits_on_eof(self, capsys, monkeypatch):
         """REPL shows banner, accepts EOF (Ctrl+D) gracefully."""
         from yui.cli import main
 
-        captured = io.StringIO()
-        with patch("sys.stdin", io.StringIO("")), \
-             patch("sys.stdout", captured), \
-             patch("sys.argv", ["yui"]):
-            main()
+        monkeypatch.setattr("sys.stdin", io.StringIO(""))
+        monkeypatch.setattr("sys.argv", ["yui"])
+        main()
 
-        output = captured.getvalue()
+        output = capsys.readouterr().out
         assert "結（Yui）" in output
         assert "Goodbye" in output
 
-    def test_repl_skips_empty_input(self):
+    def test_repl_skips_empty_input(self, capsys, monkeypatch):
         """Empty lines are skipped, REPL continues."""
         from yui.cli import main
 
         # Three empty lines then EOF
-        captured = io.StringIO()
-        with patch("sys.stdin", io.StringIO("\n\n\n")), \
-             patch("sys.stdout", captured), \
-             patch("sys.argv", ["yui"]):
-            main()
+        monkeypatch.setattr("sys.stdin", io.StringIO("\n\n\n"))
+        monkeypatch.setattr("sys.argv", ["yui"])
+        main()
 
-        output = captured.getvalue()
+        output = capsys.readouterr().out
         assert "結（Yui）" in output
         assert "Goodbye" in output
 
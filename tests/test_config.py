@@ -1,12 +1,14 @@
 """Tests for yui.config — AC-06, AC-07."""
 
+import json
 import os
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
-import yaml
 
+from tests.helpers import dump_yaml
 from yui.config import ConfigError, DEFAULT_CONFIG, load_config
 
 pytestmark = pytest.mark.unit
@@ -22,10 +24,18 @@ class TestLoadConfig:
         assert config["model"]["model_id"] == DEFAULT_CONFIG["model"]["model_id"]
         assert config["model"]["region"] == DEFAULT_CONFIG["model"]["region"]
 
+    def test_defaults_are_independent_copies(self, tmp_path):
+        """Mutating a returned default config leaves DEFAULT_CONFIG intact."""
+        config = load_config(str(tmp_path / "nonexistent.yaml"))
+        config["tools"]["shell"]["allowlist"].append("rm")
+        config["mcp"]["servers"].append({"name": "x"})
+        assert "rm" not in DEFAULT_CONFIG["tools"]["shell"]["allowlist"]
+        assert DEFAULT_CONFIG["mcp"]["servers"] == []
+
     def test_loads_valid_yaml(self, tmp_path):
         """Valid YAML merges with defaults."""
         cfg_file = tmp_path / "config.yaml"
-        cfg_file.write_text(yaml.dump({"model": {"max_tokens": 8192}}))
+        dump_yaml(cfg_file, {"model": {"max_tokens": 8192}})
         config = load_config(str(cfg_file))
         assert config["model"]["max_tokens"] == 8192
         # Other defaults still present
@@ -34,7 +44,7 @@ class TestLoadConfig:
     def test_deep_merge_preserves_nested(self, tmp_path):
         """User config merges deeply — doesn't replace entire sections."""
         cfg_file = tmp_path / "config.yaml"
-        cfg_file.write_text(yaml.dump({
+        cfg_file.write_text(json.dumps({
             "tools": {"shell": {"timeout_seconds": 60}}
         }))
         config = load_config(str(cfg_file))
@@ -49,6 +59,36 @@ class TestLoadConfig:
         config = load_config(str(cfg_file))
         assert config == DEFAULT_CONFIG
 
+    def test_repeat_load_returns_independent_copies(self, tmp_path):
+        """Cached loads of an unchanged file don't share mutable state."""
+        cfg_file = tmp_path / "config.yaml"
+        cfg_file.write_text(json.dumps({"mcp": {"servers": [{"name": "a"}]}}))
+        first = load_config(str(cfg_file))
+        first["mcp"]["servers"][0]["name"] = "mutated"
+        with patch("yui.config.yaml.load") as yaml_load:
+            second = load_config(str(cfg_file))
+        yaml_load.assert_not_called()
+        assert second["mcp"]["servers"] == [{"name": "a"}]
+
+    def test_edited_file_is_reloaded(self, tmp_path):
+        """Changing the file invalidates the cached config."""
+        cfg_file = tmp_path / "config.yaml"
+        cfg_file.write_text(json.dumps({"model": {"max_tokens": 8192}}))
+        assert load_config(str(cfg_file))["model"]["max_tokens"] == 8192
+        cfg_file.write_text(json.dumps({"model": {"max_tokens": 16384}}))
+        assert load_config(str(cfg_file))["model"]["max_tokens"] == 16384
+
+    def test_default_changes_are_picked_up(self, tmp_path, monkeypatch):
+        """Later changes to DEFAULT_CONFIG reach both default and cached-file loads."""
+        cfg_file = tmp_path / "config.yaml"
+        cfg_file.write_text(json.dumps({"model": {"max_tokens": 8192}}))
+        load_config(str(cfg_file))
+
+        monkeypatch.setitem(DEFAULT_CONFIG["model"], "region", "eu-west-1")
+
+        assert load_config(str(tmp_path / "nonexistent.yaml"))["model"]["region"] == "eu-west-1"
+        assert load_config(str(cfg_file))["model"]["region"] == "eu-west-1"
+
 
 class TestConfigValidation:
     """AC-07: Invalid config produces a clear error message and exits."""
@@ -70,21 +110,21 @@ class TestConfigValidation:
     def test_missing_model_id_raises(self, tmp_path):
         """model.model_id set to empty → ConfigError."""
         cfg_file = tmp_path / "bad_model.yaml"
-        cfg_file.write_text(yaml.dump({"model": {"model_id": ""}}))
+        cfg_file.write_text(json.dumps({"model": {"model_id": ""}}))
         with pytest.raises(ConfigError, match="model.model_id"):
             load_config(str(cfg_file))
 
     def test_missing_region_raises(self, tmp_path):
         """model.region set to empty → ConfigError."""
         cfg_file = tmp_path / "bad_region.yaml"
-        cfg_file.write_text(yaml.dump({"model": {"region": ""}}))
+        cfg_file.write_text(json.dumps({"model": {"region": ""}}))
         with pytest.raises(ConfigError, match="model.region"):
             load_config(str(cfg_file))
 
     def test_allowlist_not_list_raises(self, tmp_path):
         """tools.shell.allowlist is a string → ConfigError."""
         cfg_file = tmp_path / "bad_allow.yaml"
-        cfg_file.write_text(yaml.dump({
+        cfg_file.write_text(json.dumps({
             "tools": {"shell": {"allowlist": "not-a-list"}}
         }))
         with pytest.raises(ConfigError, match="allowlist must be a list"):
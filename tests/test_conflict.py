@@ -133,40 +133,34 @@ class TestChallengeResolution:
 class TestEscalation:
     """Tests for should_escalate."""
 
-    def test_dismissed_critical_escalates(
-        self, resolver: ConflictResolver, critical_finding: ReviewFinding
-    ) -> None:
-        challenge = resolver.challenge_finding(critical_finding, reason="false positive")
-        resolver.resolve_challenge(challenge, "I disagree. Still valid.")
-        assert resolver.should_escalate(challenge) is True
-
-    def test_unresolved_critical_escalates(
-        self, resolver: ConflictResolver, critical_finding: ReviewFinding
-    ) -> None:
-        challenge = resolver.challenge_finding(critical_finding, reason="test")
-        # resolution is "" (unresolved)
-        assert resolver.should_escalate(challenge) is True
-
-    def test_accepted_critical_no_escalation(
-        self, resolver: ConflictResolver, critical_finding: ReviewFinding
-    ) -> None:
-        challenge = resolver.challenge_finding(critical_finding, reason="false positive")
-        resolver.resolve_challenge(challenge, "I agree, false positive.")
-        assert resolver.should_escalate(challenge) is False
-
-    def test_dismissed_major_no_escalation(
-        self, resolver: ConflictResolver, major_finding: ReviewFinding
-    ) -> None:
-        challenge = resolver.challenge_finding(major_finding, reason="test")
-        resolver.resolve_challenge(challenge, "I disagree.")
-        assert resolver.should_escalate(challenge) is False
-
-    def test_minor_never_escalates(
-        self, resolver: ConflictResolver, minor_finding: ReviewFinding
+    @pytest.mark.parametrize(
+        "finding_fixture,response,expected",
+        [
+            ("critical_finding", "I disagree. Still valid.", True),
+            # response None leaves the resolution "" (unresolved)
+            ("critical_finding", None, True),
+            ("critical_finding", "I agree, false positive.", False),
+            ("major_finding", "I disagree.", False),
+            ("minor_finding", "I disagree.", False),
+        ],
+        ids=[
+            "dismissed-critical", "unresolved-critical", "accepted-critical",
+            "dismissed-major", "minor-never",
+        ],
+    )
+    def test_should_escalate(
+        self,
+        request: pytest.FixtureRequest,
+        resolver: ConflictResolver,
+        finding_fixture: str,
+        response: str | None,
+        expected: bool,
     ) -> None:
-        challenge = resolver.challenge_finding(minor_finding, reason="test")
-        resolver.resolve_challenge(challenge, "I disagree.")
-        assert resolver.should_escalate(challenge) is False
+        finding = request.getfixturevalue(finding_fixture)
+        challenge = resolver.challenge_finding(finding, reason="false positive")
+        if response is not None:
+            resolver.resolve_challenge(challenge, response)
+        assert resolver.should_escalate(challenge) is expected
 
 
 class TestEscalationSummary:
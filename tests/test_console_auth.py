@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 
-import os
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -16,14 +15,16 @@ pytestmark = pytest.mark.component
 
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def authenticator():
+    # Holds only its two timeouts and no tests reassign them, so one instance is shared
     return ConsoleAuthenticator(login_timeout_ms=5000, navigation_timeout_ms=3000)
 
 
 @pytest.fixture
 def mock_page():
-    page = AsyncMock()
+    # Only the four Page methods the authenticator awaits need to be async
+    page = MagicMock()
     page.url = "https://console.aws.amazon.com/console/home"
     page.goto = AsyncMock()
     page.wait_for_load_state = AsyncMock()
@@ -39,17 +40,15 @@ def mock_page_with_form(mock_page):
     password_input = AsyncMock()
     signin_button = AsyncMock()
 
+    # Built once per fixture; every other selector (#next_button, error
+    # banners, input[name=...] fallbacks) resolves to None.
+    form_fields = {
+        "#account": account_input, "#username": username_input,
+        "#password": password_input, "#signin_button": signin_button,
+    }
+
     async def _query_selector(selector):
-        mapping = {
-            "#account": account_input, "#username": username_input,
-            "#password": password_input, "#signin_button": signin_button,
-            "#next_button": None, "#error_message": None,
-            ".error-message": None, "[class*='error']": None,
-            "#alertMessage": None, "input[name='account']": None,
-            "input[name='username']": None, "input[name='password']": None,
-            "button[type='submit']": None,
-        }
-        return mapping.get(selector)
+        return form_fields.get(selector)
 
     mock_page.query_selector = AsyncMock(side_effect=_query_selector)
     mock_page._account_input = account_input
@@ -87,30 +86,23 @@ class TestIAMUserLogin:
         mock_page_with_form._signin_button.click.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_iam_login_uses_env_password(self, authenticator, mock_page_with_form):
-        with patch.dict(os.environ, {"YUI_CONSOLE_PASSWORD": "env_password"}):
-            config = {"method": "iam_user", "account_id": "123456789012", "username": "testuser"}
-            result = await authenticator.login(mock_page_with_form, config)
-            assert result is True
-            mock_page_with_form._password_input.fill.assert_called_once_with("env_password")
-
-    @pytest.mark.asyncio
-    async def test_iam_login_missing_account_id(self, authenticator, mock_page):
-        with pytest.raises(ValueError, match="account_id"):
-            await authenticator.login(mock_page, {"method": "iam_user", "username": "t", "password": "t"})
-
-    @pytest.mark.asyncio
-    async def test_iam_login_missing_username(self, authenticator, mock_page):
-        with pytest.raises(ValueError, match="username"):
-            await authenticator.login(mock_page, {"method": "iam_user", "account_id": "123", "password": "t"})
+    async def test_iam_login_uses_env_password(self, authenticator, mock_page_with_form, monkeypatch):
+        monkeypatch.setenv("YUI_CONSOLE_PASSWORD", "env_password")
+        config = {"method": "iam_user", "account_id": "123456789012", "username": "testuser"}
+        result = await authenticator.login(mock_page_with_form, config)
+        assert result is True
+        mock_page_with_form._password_input.fill.assert_called_once_with("env_password")
 
     @pytest.mark.asyncio
-    async def test_iam_login_missing_password(self, authenticator, mock_page):
-        with patch.dict(os.environ, {}, clear=True):
-            os.environ.pop("YUI_CONSOLE_PASSWORD", None)
-            with pytest.raises(ValueError, match="password"):
-                await authenticator.login(mock_page,
-                    {"method": "iam_user", "account_id": "123456789012", "username": "testuser"})
+    @pytest.mark.parametrize("omit", ["account_id", "username", "password"])
+    async def test_iam_login_missing_field(self, authenticator, mock_page, monkeypatch, omit):
+        # Without a config password the authenticator falls back to the env var
+        monkeypatch.delenv("YUI_CONSOLE_PASSWORD", raising=False)
+        config = {"method": "iam_user", "account_id": "123456789012",
+                  "username": "testuser", "password": "t"}
+        del config[omit]
+        with pytest.raises(ValueError, match=omit):
+            await authenticator.login(mock_page, config)
 
     @pytest.mark.asyncio
     async def test_iam_login_navigation_failure(self, authenticator, mock_page_with_form):
@@ -124,12 +116,13 @@ class TestIAMUserLogin:
         mock_page_with_form.url = "https://signin.aws.amazon.com/error"
         error_el = AsyncMock()
         error_el.inner_text = AsyncMock(return_value="Invalid username or password")
+        # mock_page_with_form always installs a coroutine side_effect
         original_qs = mock_page_with_form.query_selector.side_effect
 
         async def _with_error(selector):
             if selector == "#error_message":
                 return error_el
-            return await original_qs(selector) if callable(original_qs) else None
+            return await original_qs(selector)
 
         mock_page_with_form.query_selector = AsyncMock(side_effect=_with_error)
         with pytest.raises(ConsoleAuthError, match="Invalid username or password"):
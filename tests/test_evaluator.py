@@ -8,8 +8,8 @@ from pathlib import Path
 from unittest.mock import patch
 
 import pytest
-import yaml
 
+from tests.helpers import load_yaml
 from yui.autonomy.evaluator import TaskEvaluation, TaskEvaluator
 
 pytestmark = pytest.mark.component
@@ -72,7 +72,7 @@ class TestRecordEvaluation:
         path = evaluator.record_evaluation(ev)
         assert path.exists()
         assert path.parent.name == "evaluations"
-        data = yaml.safe_load(path.read_text())
+        data = load_yaml(path)
         assert data["task_id"] == "test-task-1"
         assert data["outcome"] == "success"
 
@@ -81,14 +81,14 @@ class TestRecordEvaluation:
             metrics={"kiro_review_rounds": 2, "critical_findings": 1},
         )
         path = evaluator.record_evaluation(ev)
-        data = yaml.safe_load(path.read_text())
+        data = load_yaml(path)
         assert data["metrics"]["kiro_review_rounds"] == 2
         assert data["metrics"]["critical_findings"] == 1
 
     def test_record_evaluation_with_lessons(self, evaluator: TaskEvaluator):
         ev = _make_eval(lessons=["Always run tests", "Check edge cases"])
         path = evaluator.record_evaluation(ev)
-        data = yaml.safe_load(path.read_text())
+        data = load_yaml(path)
         assert len(data["lessons"]) == 2
 
     def test_record_evaluation_with_improvements(self, evaluator: TaskEvaluator):
@@ -98,7 +98,7 @@ class TestRecordEvaluation:
             ],
         )
         path = evaluator.record_evaluation(ev)
-        data = yaml.safe_load(path.read_text())
+        data = load_yaml(path)
         assert data["improvements"][0]["target"] == "AGENTS.md"
 
     def test_record_evaluation_filename_format(self, evaluator: TaskEvaluator):
@@ -110,13 +110,13 @@ class TestRecordEvaluation:
     def test_record_partial_outcome(self, evaluator: TaskEvaluator):
         ev = _make_eval(outcome="partial")
         path = evaluator.record_evaluation(ev)
-        data = yaml.safe_load(path.read_text())
+        data = load_yaml(path)
         assert data["outcome"] == "partial"
 
     def test_record_failure_outcome(self, evaluator: TaskEvaluator):
         ev = _make_eval(outcome="failure")
         path = evaluator.record_evaluation(ev)
-        data = yaml.safe_load(path.read_text())
+        data = load_yaml(path)
         assert data["outcome"] == "failure"
 
 
@@ -143,7 +143,7 @@ class TestSchemaValidation:
         ev = _make_eval(outcome="not-a-valid-outcome")
         path = evaluator.record_evaluation(ev)
         assert path.exists()
-        data = yaml.safe_load(path.read_text())
+        data = load_yaml(path)
         assert "validation_errors" in data
         assert data["data"]["outcome"] == "not-a-valid-outcome"
 
@@ -177,7 +177,7 @@ class TestRecordReview:
         path = evaluator.record_review(review)
         assert path.exists()
         assert path.parent.name == "reviews"
-        data = yaml.safe_load(path.read_text())
+        data = load_yaml(path)
         assert data["review_id"] == "review-001"
 
     def test_record_review_filename(self, evaluator: TaskEvaluator):
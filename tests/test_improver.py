@@ -8,8 +8,8 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch, call
 
 import pytest
-import yaml
 
+from tests.helpers import load_yaml
 from yui.autonomy.evaluator import TaskEvaluation, TaskEvaluator
 from yui.autonomy.improver import (
     DirectModificationError,
@@ -270,7 +270,7 @@ class TestRollbackPR:
     def test_rollback_records_to_file(self, improver: SelfImprover, mock_git: MagicMock, memory_dir: Path):
         path = improver.rollback_pr(42, "Metrics degraded by 25%")
         assert path.exists()
-        data = yaml.safe_load(path.read_text())
+        data = load_yaml(path)
         assert data["pr_number"] == 42
         assert data["reason"] == "Metrics degraded by 25%"
         assert data["action"] == "auto-reverted"
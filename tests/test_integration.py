@@ -20,7 +20,8 @@ from pathlib import Path
 from unittest import mock
 
 import pytest
-import yaml
+
+from tests.helpers import dump_yaml
 
 pytestmark = pytest.mark.integration
 
@@ -63,7 +64,7 @@ class TestConfigIntegration:
             },
         }
         config_file = tmp_path / "config.yaml"
-        config_file.write_text(yaml.dump(config_data))
+        dump_yaml(config_file, config_data)
 
         from yui.config import load_config
 
@@ -256,6 +257,7 @@ class TestGitToolIntegration:
 
 
 @pytest.mark.integration
+@pytest.mark.aws
 @pytest.mark.skipif(
     not os.environ.get("YUI_TEST_AWS", ""),
     reason="Set YUI_TEST_AWS=1 to run AWS integration tests",
@@ -410,6 +412,7 @@ class TestSlackIntegration:
 
 
 @pytest.mark.e2e
+@pytest.mark.aws
 @pytest.mark.skipif(
     not os.environ.get("YUI_TEST_AWS", ""),
     reason="Set YUI_TEST_AWS=1 to run E2E tests",
@@ -6,6 +6,8 @@ import pytest
 import boto3
 from botocore.exceptions import ClientError
 
+from tests.helpers import cm
+from yui.tools import agentcore
 from yui.tools.agentcore import kb_retrieve, web_search
 
 pytestmark = pytest.mark.component
@@ -14,9 +16,9 @@ pytestmark = pytest.mark.component
 
 # --- kb_retrieve tests (Issue #48) ---
 
-@patch("yui.tools.agentcore.AGENTCORE_AVAILABLE", True)
+@patch.object(agentcore, "AGENTCORE_AVAILABLE", True)
 @patch("boto3.client")
-@patch("yui.tools.agentcore._get_config")
+@patch.object(agentcore, "_get_config")
 def test_kb_retrieve_success(mock_config, mock_boto_client):
     """Test successful Knowledge Base retrieval."""
     # Mock config
@@ -52,8 +54,8 @@ def test_kb_retrieve_success(mock_config, mock_boto_client):
     )
 
 
-@patch("yui.tools.agentcore.AGENTCORE_AVAILABLE", True)
-@patch("yui.tools.agentcore._get_config")
+@patch.object(agentcore, "AGENTCORE_AVAILABLE", True)
+@patch.object(agentcore, "_get_config")
 def test_kb_retrieve_no_kb_configured(mock_config):
     """Test Knowledge Base retrieval with no KB ID configured."""
     mock_config.return_value = {"tools": {"web_search": {"knowledge_base_id": ""}}}
@@ -64,9 +66,9 @@ def test_kb_retrieve_no_kb_configured(mock_config):
     assert "config.yaml" in result
 
 
-@patch("yui.tools.agentcore.AGENTCORE_AVAILABLE", True)
+@patch.object(agentcore, "AGENTCORE_AVAILABLE", True)
 @patch("boto3.client")
-@patch("yui.tools.agentcore._get_config")
+@patch.object(agentcore, "_get_config")
 def test_kb_retrieve_access_denied(mock_config, mock_boto_client):
     """Test Knowledge Base retrieval with permission error."""
     mock_config.return_value = {"tools": {"web_search": {"knowledge_base_id": "kb-123"}}}
@@ -84,9 +86,9 @@ def test_kb_retrieve_access_denied(mock_config, mock_boto_client):
     assert "bedrock:Retrieve" in result
 
 
-@patch("yui.tools.agentcore.AGENTCORE_AVAILABLE", True)
+@patch.object(agentcore, "AGENTCORE_AVAILABLE", True)
 @patch("boto3.client")
-@patch("yui.tools.agentcore._get_config")
+@patch.object(agentcore, "_get_config")
 def test_kb_retrieve_empty_results(mock_config, mock_boto_client):
     """Test Knowledge Base retrieval with no results."""
     mock_config.return_value = {"tools": {"web_search": {"knowledge_base_id": "kb-123"}}}
@@ -101,9 +103,9 @@ def test_kb_retrieve_empty_results(mock_config, mock_boto_client):
     assert "nonexistent query" in result
 
 
-@patch("yui.tools.agentcore.AGENTCORE_AVAILABLE", True)
+@patch.object(agentcore, "AGENTCORE_AVAILABLE", True)
 @patch("boto3.client")
-@patch("yui.tools.agentcore._get_config")
+@patch.object(agentcore, "_get_config")
 def test_kb_retrieve_resource_not_found(mock_config, mock_boto_client):
     """Test Knowledge Base retrieval with ResourceNotFoundException."""
     mock_config.return_value = {"tools": {"web_search": {"knowledge_base_id": "kb-123"}}}
@@ -121,8 +123,8 @@ def test_kb_retrieve_resource_not_found(mock_config, mock_boto_client):
     assert "config.yaml" in result
 
 
-@patch("yui.tools.agentcore.AGENTCORE_AVAILABLE", True)
-@patch("yui.tools.agentcore._get_config")
+@patch.object(agentcore, "AGENTCORE_AVAILABLE", True)
+@patch.object(agentcore, "_get_config")
 def test_kb_retrieve_empty_query(mock_config):
     """Test Knowledge Base retrieval with empty query."""
     mock_config.return_value = {"tools": {"web_search": {"knowledge_base_id": "kb-123"}}}
@@ -136,8 +138,8 @@ def test_kb_retrieve_empty_query(mock_config):
     assert "Error: Query cannot be empty" in result
 
 
-@patch("yui.tools.agentcore.AGENTCORE_AVAILABLE", True)
-@patch("yui.tools.agentcore.browser_session")
+@patch.object(agentcore, "AGENTCORE_AVAILABLE", True)
+@patch.object(agentcore, "browser_session")
 def test_web_search_empty_query(mock_session):
     """Test web search with empty query."""
     result = web_search("", 5)
@@ -149,8 +151,8 @@ def test_web_search_empty_query(mock_session):
     assert "Error: Search query cannot be empty" in result
 
 
-@patch("yui.tools.agentcore.AGENTCORE_AVAILABLE", True)
-@patch("yui.tools.agentcore.browser_session")
+@patch.object(agentcore, "AGENTCORE_AVAILABLE", True)
+@patch.object(agentcore, "browser_session")
 def test_web_search_invalid_num_results(mock_session):
     """Test web search with invalid num_results parameter."""
     # Test negative number
@@ -170,10 +172,10 @@ def test_web_search_invalid_num_results(mock_session):
     assert "Error: num_results must be an integer between 1 and 100" in result
 
 
-@patch("yui.tools.agentcore.AGENTCORE_AVAILABLE", True)
-@patch("yui.tools.agentcore.PLAYWRIGHT_AVAILABLE", True)
-@patch("yui.tools.agentcore.sync_playwright", create=True)
-@patch("yui.tools.agentcore.browser_session")
+@patch.object(agentcore, "AGENTCORE_AVAILABLE", True)
+@patch.object(agentcore, "PLAYWRIGHT_AVAILABLE", True)
+@patch.object(agentcore, "sync_playwright", create=True)
+@patch.object(agentcore, "browser_session")
 def test_web_search_special_characters(mock_session, mock_playwright):
     """Test web search with special characters in query — URL is properly encoded."""
     mock_browser_client = MagicMock()
@@ -181,8 +183,7 @@ def test_web_search_special_characters(mock_session, mock_playwright):
     mock_browser_client.generate_ws_headers.return_value = (
         "wss://example.com/browser", {"Authorization": "SigV4 xxx"}
     )
-    mock_session.return_value.__enter__ = MagicMock(return_value=mock_browser_client)
-    mock_session.return_value.__exit__ = MagicMock(return_value=False)
+    mock_session.return_value = cm(mock_browser_client)
 
     mock_page = MagicMock()
     mock_page.content.return_value = "Search results for special characters"
@@ -199,10 +200,10 @@ def test_web_search_special_characters(mock_session, mock_playwright):
     assert "C%2B%2B" in call_args[0][0] or "C%2B%2B" in str(call_args)
 
 
-@patch("yui.tools.agentcore.AGENTCORE_AVAILABLE", True)
-@patch("yui.tools.agentcore.PLAYWRIGHT_AVAILABLE", True)
-@patch("yui.tools.agentcore.sync_playwright", create=True)
-@patch("yui.tools.agentcore.browser_session")
+@patch.object(agentcore, "AGENTCORE_AVAILABLE", True)
+@patch.object(agentcore, "PLAYWRIGHT_AVAILABLE", True)
+@patch.object(agentcore, "sync_playwright", create=True)
+@patch.object(agentcore, "browser_session")
 def test_web_search_empty_results(mock_session, mock_playwright):
     """Test web search with no results from browser."""
     mock_browser_client = MagicMock()
@@ -210,8 +211,7 @@ def test_web_search_empty_results(mock_session, mock_playwright):
     mock_browser_client.generate_ws_headers.return_value = (
         "wss://example.com/browser", {"Authorization": "SigV4 xxx"}
     )
-    mock_session.return_value.__enter__ = MagicMock(return_value=mock_browser_client)
-    mock_session.return_value.__exit__ = MagicMock(return_value=False)
+    mock_session.return_value = cm(mock_browser_client)
 
     mock_page = MagicMock()
     mock_page.content.return_value = ""  # empty results
@@ -227,10 +227,10 @@ def test_web_search_empty_results(mock_session, mock_playwright):
 
 # --- web_search tests (Issue #53) ---
 
-@patch("yui.tools.agentcore.AGENTCORE_AVAILABLE", True)
-@patch("yui.tools.agentcore.PLAYWRIGHT_AVAILABLE", True)
-@patch("yui.tools.agentcore.sync_playwright", create=True)
-@patch("yui.tools.agentcore.browser_session")
+@patch.object(agentcore, "AGENTCORE_AVAILABLE", True)
+@patch.object(agentcore, "PLAYWRIGHT_AVAILABLE", True)
+@patch.object(agentcore, "sync_playwright", create=True)
+@patch.object(agentcore, "browser_session")
 def test_web_search_success(mock_session, mock_playwright):
     """Test successful web search via AgentCore Browser + Playwright."""
     # Mock BrowserClient
@@ -239,8 +239,7 @@ def test_web_search_success(mock_session, mock_playwright):
     mock_browser_client.generate_ws_headers.return_value = (
         "wss://example.com/browser", {"Authorization": "SigV4 xxx"}
     )
-    mock_session.return_value.__enter__ = MagicMock(return_value=mock_browser_client)
-    mock_session.return_value.__exit__ = MagicMock(return_value=False)
+    mock_session.return_value = cm(mock_browser_client)
 
     # Mock Playwright CDP connection
     mock_page = MagicMock()
@@ -255,10 +254,10 @@ def test_web_search_success(mock_session, mock_playwright):
     assert "Best practices for AI" in result
 
 
-@patch("yui.tools.agentcore.AGENTCORE_AVAILABLE", True)
-@patch("yui.tools.agentcore.PLAYWRIGHT_AVAILABLE", True)
-@patch("yui.tools.agentcore.sync_playwright", create=True)
-@patch("yui.tools.agentcore.browser_session")
+@patch.object(agentcore, "AGENTCORE_AVAILABLE", True)
+@patch.object(agentcore, "PLAYWRIGHT_AVAILABLE", True)
+@patch.object(agentcore, "sync_playwright", create=True)
+@patch.object(agentcore, "browser_session")
 def test_web_search_with_default_num_results(mock_session, mock_playwright):
     """Test web search with default number of results."""
     mock_browser_client = MagicMock()
@@ -266,8 +265,7 @@ def test_web_search_with_default_num_results(mock_session, mock_playwright):
     mock_browser_client.generate_ws_headers.return_value = (
         "wss://example.com/browser", {"Authorization": "SigV4 xxx"}
     )
-    mock_session.return_value.__enter__ = MagicMock(return_value=mock_browser_client)
-    mock_session.return_value.__exit__ = MagicMock(return_value=False)
+    mock_session.return_value = cm(mock_browser_client)
 
     mock_page = MagicMock()
     mock_page.content.return_value = "Default search results"
@@ -280,7 +278,7 @@ def test_web_search_with_default_num_results(mock_session, mock_playwright):
     assert "Default search results" in result
 
 
-@patch("yui.tools.agentcore.AGENTCORE_AVAILABLE", False)
+@patch.object(agentcore, "AGENTCORE_AVAILABLE", False)
 def test_web_search_unavailable():
     """Test web search when AgentCore SDK not available."""
     result = web_search("test query", 5)
@@ -288,15 +286,15 @@ def test_web_search_unavailable():
     assert "Error: bedrock-agentcore SDK not installed" in result
 
 
-@patch("yui.tools.agentcore.AGENTCORE_AVAILABLE", True)
-@patch("yui.tools.agentcore.PLAYWRIGHT_AVAILABLE", True)
-@patch("yui.tools.agentcore.browser_session")
+@patch.object(agentcore, "AGENTCORE_AVAILABLE", True)
+@patch.object(agentcore, "PLAYWRIGHT_AVAILABLE", True)
+@patch.object(agentcore, "browser_session")
 def test_web_search_browser_error(mock_session):
     """Test web search with browser session ResourceNotFoundException."""
-    mock_session.return_value.__enter__ = MagicMock(
-        side_effect=Exception("ResourceNotFoundException: Browser resource not found")
-    )
-    mock_session.return_value.__exit__ = MagicMock(return_value=False)
+    mock_session.return_value = cm(enter_error=ClientError(
+        {"Error": {"Code": "ResourceNotFoundException", "Message": "Browser resource not found"}},
+        "StartBrowserSession",
+    ))
 
     result = web_search("test query", 5)
 
@@ -315,7 +313,7 @@ except ImportError:
 @pytest.mark.e2e
 @pytest.mark.aws
 @pytest.mark.skipif(not AWS_AVAILABLE, reason="boto3 not installed")
-@patch("yui.tools.agentcore.AGENTCORE_AVAILABLE", True)
+@patch.object(agentcore, "AGENTCORE_AVAILABLE", True)
 def test_kb_retrieve_e2e():
     """E2E test for Knowledge Base retrieval with real AWS resources."""
     # This will only run if:
@@ -328,7 +326,7 @@ def test_kb_retrieve_e2e():
 @pytest.mark.e2e
 @pytest.mark.aws
 @pytest.mark.skipif(not AWS_AVAILABLE, reason="boto3 not installed")
-@patch("yui.tools.agentcore.AGENTCORE_AVAILABLE", True)
+@patch.object(agentcore, "AGENTCORE_AVAILABLE", True)
 @pytest.mark.skipif(
     not os.getenv("YUI_AWS_E2E"),
     reason="Requires YUI_AWS_E2E=1 and real AgentCore Browser provisioning"
@@ -6,6 +6,7 @@ from unittest.mock import MagicMock, call, patch
 
 import pytest
 
+from tests.helpers import dump_yaml
 from yui.tools.mcp_integration import (
     MCPConfigError,
     MCPConnectionError,
@@ -593,7 +594,6 @@ class TestConfigIntegration:
 
     def test_load_config_with_mcp_servers(self, tmp_path):
         """Config file with MCP servers loads correctly."""
-        import yaml
         from yui.config import load_config
 
         config_data = {
@@ -608,7 +608,7 @@ class TestConfigIntegration:
             }
         }
         config_file = tmp_path / "config.yaml"
-        config_file.write_text(yaml.dump(config_data))
+        dump_yaml(config_file, config_data)
 
         config = load_config(str(config_file))
         assert len(config["mcp"]["servers"]) == 1
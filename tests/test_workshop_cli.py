@@ -34,7 +34,7 @@ def _run_cli(args):
 
 
 class TestWorkshopTestCommand:
-    @patch("yui.config.load_config")
+    @patch("yui.cli.load_config")
     @patch("yui.workshop.runner.WorkshopTestRunner")
     def test_test_command_basic(self, mock_runner_cls, mock_load_config):
         mock_load_config.return_value = {"workshop": {"test": {"output_dir": "/tmp"}}}
@@ -46,7 +46,7 @@ class TestWorkshopTestCommand:
         assert code == 0
         assert "Starting workshop test" in out
 
-    @patch("yui.config.load_config")
+    @patch("yui.cli.load_config")
     @patch("yui.workshop.runner.WorkshopTestRunner")
     def test_dry_run_flag(self, mock_runner_cls, mock_load_config):
         mock_load_config.return_value = {"workshop": {"test": {"output_dir": "/tmp"}}}
@@ -58,7 +58,7 @@ class TestWorkshopTestCommand:
         assert code == 0
         assert "Dry-run" in out
 
-    @patch("yui.config.load_config")
+    @patch("yui.cli.load_config")
     @patch("yui.workshop.runner.WorkshopTestRunner")
     def test_cron_flag(self, mock_runner_cls, mock_load_config):
         mock_load_config.return_value = {"workshop": {"test": {"output_dir": "/tmp"}}}
@@ -70,7 +70,7 @@ class TestWorkshopTestCommand:
         assert code == 0
         assert "Regression mode" in out
 
-    @patch("yui.config.load_config")
+    @patch("yui.cli.load_config")
     @patch("yui.workshop.runner.WorkshopTestRunner")
     def test_steps_flag(self, mock_runner_cls, mock_load_config):
         mock_load_config.return_value = {"workshop": {"test": {"output_dir": "/tmp"}}}
@@ -81,7 +81,7 @@ class TestWorkshopTestCommand:
             code, out, err = _run_cli(["workshop", "test", "https://catalog.workshops.aws/example", "--steps", "1-3"])
         assert code == 0
 
-    @patch("yui.config.load_config")
+    @patch("yui.cli.load_config")
     @patch("yui.workshop.runner.WorkshopTestRunner")
     def test_record_flag(self, mock_runner_cls, mock_load_config):
         mock_load_config.return_value = {"workshop": {"test": {"output_dir": "/tmp"}}}
@@ -94,7 +94,7 @@ class TestWorkshopTestCommand:
 
 
 class TestWorkshopListTests:
-    @patch("yui.config.load_config")
+    @patch("yui.cli.load_config")
     @patch("yui.workshop.runner.WorkshopTestRunner")
     def test_list_tests_empty(self, mock_runner_cls, mock_load_config):
         mock_load_config.return_value = {"workshop": {"test": {"output_dir": "/tmp"}}}
@@ -105,7 +105,7 @@ class TestWorkshopListTests:
         assert code == 0
         assert "No test runs found" in out
 
-    @patch("yui.config.load_config")
+    @patch("yui.cli.load_config")
     @patch("yui.workshop.runner.WorkshopTestRunner")
     def test_list_tests_with_results(self, mock_runner_cls, mock_load_config):
         mock_load_config.return_value = {"workshop": {"test": {"output_dir": "/tmp"}}}
@@ -120,7 +120,7 @@ class TestWorkshopListTests:
 
 
 class TestWorkshopShowReport:
-    @patch("yui.config.load_config")
+    @patch("yui.cli.load_config")
     @patch("yui.workshop.runner.WorkshopTestRunner")
     def test_show_report_found(self, mock_runner_cls, mock_load_config):
         mock_load_config.return_value = {"workshop": {"test": {"output_dir": "/tmp"}}}
@@ -131,7 +131,7 @@ class TestWorkshopShowReport:
         assert code == 0
         assert "# Test Report Content" in out
 
-    @patch("yui.config.load_config")
+    @patch("yui.cli.load_config")
     @patch("yui.workshop.runner.WorkshopTestRunner")
     def test_show_report_not_found(self, mock_runner_cls, mock_load_config):
         mock_load_config.return_value = {"workshop": {"test": {"output_dir": "/tmp"}}}
@@ -144,7 +144,7 @@ class TestWorkshopShowReport:
 
 
 class TestWorkshopNoAction:
-    @patch("yui.config.load_config")
+    @patch("yui.cli.load_config")
     def test_no_workshop_action(self, mock_load_config):
         mock_load_config.return_value = {"workshop": {"test": {"output_dir": "/tmp"}}}
         code, out, err = _run_cli(["workshop"])